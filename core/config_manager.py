@@ -7,8 +7,10 @@ Handles Include statement integration with ~/.ssh/config.
 
 import os
 import shutil
+import threading
+from dataclasses import replace
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 
 from .connection import Connection
@@ -42,6 +44,13 @@ class ConfigManager:
         self.ssh_config = self.ssh_dir / "config"
         self.backup_path = self.ssh_dir / "config.backup"
 
+        # (connections, stats) from load_snapshot, dropped on any change.
+        # Loads may run on a worker thread: the generation counter stops a
+        # load that raced with a change from caching stale results.
+        self._snapshot: Optional[Tuple[List[Connection], Dict[str, Any]]] = None
+        self._snapshot_generation = 0
+        self._snapshot_lock = threading.Lock()
+
     def initialize(self) -> Dict[str, Any]:
         """
         Initialize SSH Manager.
@@ -63,6 +72,8 @@ class ConfigManager:
             'message': ''
         }
 
+        self.invalidate_snapshot()
+
         # Create base directory structure
         if not self.base_path.exists():
             self.base_path.mkdir(parents=True, exist_ok=True)
@@ -187,6 +198,7 @@ class ConfigManager:
         config_file = folder_path / f"{conn.name}.conf"
         config_content = conn.to_ssh_config()
         config_file.write_text(config_content)
+        self.invalidate_snapshot()
 
     def load_connection(self, folder: str, name: str) -> Connection:
         """
@@ -227,6 +239,7 @@ class ConfigManager:
             raise FileNotFoundError(f"Connection '{name}' not found in folder '{folder}'")
 
         config_file.unlink()
+        self.invalidate_snapshot()
 
     def connection_exists(self, folder: str, name: str) -> bool:
         """
@@ -305,6 +318,7 @@ class ConfigManager:
 
         # Move file
         shutil.move(str(old_file), str(new_file))
+        self.invalidate_snapshot()
 
         # Update connection object
         conn.folder = new_folder
@@ -318,6 +332,7 @@ class ConfigManager:
         """
         folder = self.base_path / folder_path
         folder.mkdir(parents=True, exist_ok=True)
+        self.invalidate_snapshot()
 
     def delete_folder(self, folder_path: str, recursive: bool = False) -> None:
         """
@@ -342,6 +357,7 @@ class ConfigManager:
             shutil.rmtree(folder)
         else:
             folder.rmdir()
+        self.invalidate_snapshot()
 
     def list_folders(self) -> List[str]:
         """
@@ -420,23 +436,59 @@ class ConfigManager:
         Returns:
             Dict with stats
         """
-        all_connections = self.list_connections()
-        folders = self.list_folders()
+        return self._build_stats(self.list_connections())
+
+    def load_snapshot(self) -> Tuple[List[Connection], Dict[str, Any]]:
+        """
+        Load all connections and their stats in one pass.
+
+        The result is cached until a connection or folder is changed
+        through this manager (or invalidate_snapshot() is called). Each
+        call returns fresh Connection copies, so callers may modify them
+        (e.g. via move_connection) without touching the cache.
+
+        Returns:
+            Tuple of (connections, stats as returned by get_stats)
+        """
+        with self._snapshot_lock:
+            snapshot = self._snapshot
+            generation = self._snapshot_generation
+
+        if snapshot is None:
+            connections = self.list_connections()
+            snapshot = (connections, self._build_stats(connections))
+
+            with self._snapshot_lock:
+                if generation == self._snapshot_generation:
+                    self._snapshot = snapshot
+
+        connections, stats = snapshot
+        copies = [
+            replace(
+                conn,
+                local_forwards=list(conn.local_forwards),
+                remote_forwards=list(conn.remote_forwards),
+            )
+            for conn in connections
+        ]
+        return copies, dict(stats)
+
+    def invalidate_snapshot(self) -> None:
+        """Drop the cached load_snapshot() result (e.g. after external edits)."""
+        with self._snapshot_lock:
+            self._snapshot = None
+            self._snapshot_generation += 1
+
+    def _build_stats(self, connections: List[Connection]) -> Dict[str, Any]:
+        """Build get_stats() output from already loaded connections."""
+        counts = {}
+        for conn in connections:
+            counts[conn.folder] = counts.get(conn.folder, 0) + 1
 
         return {
-            'total_connections': len(all_connections),
-            'total_folders': len(folders),
-            'connections_by_folder': self._count_connections_by_folder(),
+            'total_connections': len(connections),
+            'total_folders': len(self.list_folders()),
+            'connections_by_folder': counts,
             'base_path': str(self.base_path),
             'ssh_config': str(self.ssh_config)
         }
-
-    def _count_connections_by_folder(self) -> Dict[str, int]:
-        """Count connections per folder."""
-        counts = {}
-
-        for config_file in self.base_path.rglob("*.conf"):
-            folder = str(config_file.parent.relative_to(self.base_path))
-            counts[folder] = counts.get(folder, 0) + 1
-
-        return counts
@@ -11,6 +11,15 @@ from dataclasses import dataclass, field
 from typing import List, Tuple, Optional, Dict, Any
 
 
+# Display prefix per color tag (untagged connections get a computer icon)
+_COLOR_EMOJI = {
+    'production': '🔴 ',
+    'staging': '🟡 ',
+    'development': '🟢 '
+}
+_DEFAULT_EMOJI = '💻 '
+
+
 @dataclass
 class Connection:
     """
@@ -40,6 +49,18 @@ class Connection:
     remote_forwards: List[Tuple[int, str, int]] = field(default_factory=list)
     color_tag: str = ""  # "production", "staging", "development", or ""
 
+    # (folder, folder.split('/')) cache backing folder_parts
+    _folder_parts: Optional[Tuple[str, Tuple[str, ...]]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    @property
+    def folder_parts(self) -> Tuple[str, ...]:
+        """Folder path split into its components (cached until folder changes)."""
+        if self._folder_parts is None or self._folder_parts[0] != self.folder:
+            self._folder_parts = (self.folder, tuple(self.folder.split('/')))
+        return self._folder_parts[1]
+
     def to_ssh_config(self) -> str:
         """
         Generate SSH config file content.
@@ -241,13 +262,7 @@ class Connection:
 
     def get_display_name(self) -> str:
         """Get display name with color indicator."""
-        color_emoji = {
-            'production': '🔴',
-            'staging': '🟡',
-            'development': '🟢'
-        }
-        emoji = color_emoji.get(self.color_tag, '💻')
-        return f"{emoji} {self.name}"
+        return _COLOR_EMOJI.get(self.color_tag, _DEFAULT_EMOJI) + self.name
 
     def __str__(self) -> str:
         """String representation."""
@@ -9,7 +9,7 @@ Manage your SSH connections with a simple GUI instead of manually editing config
 import sys
 from pathlib import Path
 
-# Add project root to path
+# Add project root to path (ui/ and core/ import each other as top-level packages)
 sys.path.insert(0, str(Path(__file__).parent))
 
 from PySide6.QtWidgets import QApplication
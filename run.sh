@@ -16,20 +16,23 @@ fi
 # Activate virtual environment
 source venv/bin/activate
 
+# Make the ssh_manager package importable from the source tree
+export PYTHONPATH="src${PYTHONPATH:+:$PYTHONPATH}"
+
 # Check if we should run GUI or CLI
 if [ "$1" = "gui" ] || [ $# -eq 0 ]; then
     # Check if tkinter is available
     if python -c "import tkinter" 2>/dev/null; then
         echo "🚀 Launching SSH Manager GUI..."
-        python src/ssh_manager/main.py gui
+        python -m ssh_manager.main gui
     else
         echo "❌ Tkinter not available for GUI. Please install:"
         echo "   sudo apt install python3-tkinter"
         echo ""
         echo "📋 Available CLI commands:"
-        python src/ssh_manager/main.py --help
+        python -m ssh_manager.main --help
     fi
 else
     # Run CLI with all arguments
-    python src/ssh_manager/main.py "$@"
+    python -m ssh_manager.main "$@"
 fi
\ No newline at end of file
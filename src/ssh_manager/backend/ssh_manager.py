@@ -5,21 +5,74 @@ import subprocess
 import zipfile
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 import paramiko
 from .file_utils import FileUtils
 from .templates import Templates
 
 
+class _ConfigCache:
+    """Parsed connection config files, reused while a file's mtime is unchanged."""
+    
+    def __init__(self):
+        self._entries: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+        
+    def get(self, path: Path) -> Optional[Dict[str, Any]]:
+        """Get the parsed entry for a config file, re-reading it only if it changed."""
+        try:
+            mtime_ns = os.stat(path).st_mtime_ns
+        except FileNotFoundError:
+            self._entries.pop(path, None)
+            return None
+            
+        cached = self._entries.get(path)
+        if cached and cached[0] == mtime_ns:
+            return cached[1]
+            
+        entry = self._parse(path.read_text(encoding='utf-8'))
+        self._entries[path] = (mtime_ns, entry)
+        return entry
+        
+    def invalidate(self, path: Optional[Path] = None):
+        """Drop one cached file, or everything if no path is given."""
+        if path is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(path, None)
+            
+    @staticmethod
+    def _parse(config_content: str) -> Dict[str, Any]:
+        """Extract the icon metadata from a connection config."""
+        icon = '💻'  # default icon
+        lines = config_content.split('\n')
+        if lines and lines[0].strip().startswith('# SSH Manager Icon:'):
+            try:
+                icon_part = lines[0].strip().split('# SSH Manager Icon:', 1)
+                if len(icon_part) > 1:
+                    icon = icon_part[1].strip()
+            except (IndexError, AttributeError):
+                pass  # Use default icon if parsing fails
+                
+        return {'icon': icon, 'config': config_content}
+
+
+# Shared by every SSHManager instance in the process
+_config_cache = _ConfigCache()
+
+
 class SSHManager:
     """Main SSH Manager class for handling SSH connections and configurations."""
     
     def __init__(self):
         self.file_utils = FileUtils()
         self.templates = Templates()
+        self._initialized = False
         
     def init(self):
-        """Initialize SSH Manager."""
+        """Initialize SSH Manager (only the first call does any work)."""
+        if self._initialized:
+            return
+            
         # Create backup of original SSH config before any modifications
         self.create_ssh_config_backup_if_needed()
         
@@ -30,6 +83,7 @@ class SSHManager:
         # Update main SSH config to include our files
         self.update_main_ssh_config()
         
+        self._initialized = True
         print(f"SSH Manager initialized at: {self.file_utils.get_ssh_manager_path()}")
         
     def create_ssh_config_backup_if_needed(self) -> Dict[str, Any]:
@@ -117,6 +171,7 @@ class SSHManager:
         
         # Write config file
         self.file_utils.write_config_file(group, name, config_with_icon)
+        _config_cache.invalidate(self.file_utils.get_connection_file_path(group, name))
         
         # Update main SSH config
         self.update_main_ssh_config()
@@ -124,32 +179,26 @@ class SSHManager:
         return {'success': True, 'name': name, 'group': group}
         
     def list_connections(self, group_filter: Optional[str] = None) -> List[Dict[str, Any]]:
-        """List all connections, optionally filtered by group."""
+        """
+        List all connections, optionally filtered by group.
+        
+        Connections are returned sorted by (group, name), since both the
+        groups and the connections inside each group are listed in order.
+        """
         connections = []
         groups = [group_filter] if group_filter else self.file_utils.list_groups()
 
         for group in groups:
             connection_names = self.file_utils.list_connections_in_group(group)
             for name in connection_names:
-                config_content = self.file_utils.read_config_file(group, name)
-
-                # Extract icon from comment if present
-                icon = '💻'  # default icon
-                if config_content:
-                    lines = config_content.split('\n')
-                    if lines and lines[0].strip().startswith('# SSH Manager Icon:'):
-                        try:
-                            icon_part = lines[0].strip().split('# SSH Manager Icon:', 1)
-                            if len(icon_part) > 1:
-                                icon = icon_part[1].strip()
-                        except (IndexError, AttributeError):
-                            pass  # Use default icon if parsing fails
+                file_path = self.file_utils.get_connection_file_path(group, name)
+                entry = _config_cache.get(file_path) or {'icon': '💻', 'config': None}
 
                 connections.append({
                     'name': name,
                     'group': group,
-                    'icon': icon,
-                    'config': config_content
+                    'icon': entry['icon'],
+                    'config': entry['config']
                 })
 
         return connections
@@ -157,6 +206,7 @@ class SSHManager:
     def remove_connection(self, name: str, group: str):
         """Remove a connection."""
         self.file_utils.delete_config_file(group, name)
+        _config_cache.invalidate(self.file_utils.get_connection_file_path(group, name))
         self.update_main_ssh_config()
         
     def update_connection(self, name: str, group: str, updates: Dict[str, Any]):
@@ -293,7 +343,10 @@ class SSHManager:
             backup_path = str(self.file_utils.ssh_manager_dir / f"backup_{timestamp}.zip")
             
         try:
-            with zipfile.ZipFile(backup_path, 'w', zipfile.ZIP_DEFLATED) as zipf:
+            # Configs are small text files: favour speed over ratio and
+            # write through a large buffer
+            with open(backup_path, 'wb', buffering=1 << 20) as backup_file, \
+                    zipfile.ZipFile(backup_file, 'w', zipfile.ZIP_DEFLATED, compresslevel=1) as zipf:
                 config_dir = self.file_utils.ssh_manager_dir / 'config'
                 
                 for file_path in config_dir.rglob('*.conf'):
@@ -309,6 +362,7 @@ class SSHManager:
         """Revert to original SSH config."""
         try:
             self.file_utils.revert_to_original_config()
+            _config_cache.invalidate()
             return {'success': True, 'message': 'Reverted to original SSH config'}
         except Exception as e:
             return {'success': False, 'error': str(e)}
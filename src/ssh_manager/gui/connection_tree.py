@@ -13,6 +13,7 @@ class ConnectionTreeView(ttk.Frame):
         
         self.selection_callback = selection_callback
         self.connections_data = {}  # Store connection data by tree item ID
+        self.group_items = {}  # Tree item ID by group path
         
         self.create_widgets()
         
@@ -44,27 +45,23 @@ class ConnectionTreeView(ttk.Frame):
         # Bind double-click event (could be used for quick connect)
         self.tree.bind("<Double-1>", self.on_double_click)
         
-    def load_connections(self, connections: List[Dict[str, Any]]):
-        """Load connections into the tree view."""
+    def load_connections(self, groups: Dict[str, List[Dict[str, Any]]]):
+        """
+        Load connections into the tree view.
+        
+        Args:
+            groups: Connections keyed by group path, with groups and the
+                connections inside each group already in display order
+        """
         # Clear existing items
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
         self.connections_data.clear()
+        self.group_items.clear()
         
-        # Organize connections by group hierarchy
-        groups = {}
-        for connection in connections:
-            group_path = connection['group']
-            if group_path not in groups:
-                groups[group_path] = []
-            groups[group_path].append(connection)
-            
-        # Sort groups and add to tree
-        for group_path in sorted(groups.keys()):
+        for group_path, group_connections in groups.items():
             group_item_id = self.add_group_to_tree(group_path)
             
             # Add connections to this group
-            group_connections = sorted(groups[group_path], key=lambda x: x['name'])
             for connection in group_connections:
                 self.add_connection_to_tree(group_item_id, connection)
                 
@@ -103,6 +100,7 @@ class ConnectionTreeView(ttk.Frame):
                     'name': part,
                     'path': current_path
                 }
+                self.group_items[current_path] = group_item_id
                 
             current_parent = group_item_id
             
@@ -110,10 +108,7 @@ class ConnectionTreeView(ttk.Frame):
         
     def find_group_item(self, group_path: str) -> Optional[str]:
         """Find an existing group item by path."""
-        for item_id, data in self.connections_data.items():
-            if data.get('type') == 'group' and data.get('path') == group_path:
-                return item_id
-        return None
+        return self.group_items.get(group_path)
         
     def add_connection_to_tree(self, parent_item: str, connection: Dict[str, Any]):
         """Add a connection to the tree under the specified parent group."""
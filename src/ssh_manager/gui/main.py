@@ -4,15 +4,66 @@ import tkinter as tk
 from tkinter import ttk, messagebox
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-# Add the parent directory to the Python path
-sys.path.insert(0, str(Path(__file__).parent.parent))
-
-from backend.ssh_manager import SSHManager
+from ..backend.ssh_manager import SSHManager
 from .connection_tree import ConnectionTreeView
-from .dialogs.add_connection import AddConnectionDialog
-from .dialogs.edit_connection import EditConnectionDialog
+
+
+_ICON_PATH = Path(__file__).resolve().parents[3] / "assets" / "icons" / "icon.png"
+
+# Menu bar layout: (menu label, ((item label, method name, accelerator), ...)).
+# A "-" label is a separator.
+_MENU_SPEC = (
+    ("File", (
+        ("Add Connection...", "add_connection", "Ctrl+N"),
+        ("-", None, None),
+        ("Export Connections...", "export_connections", "Ctrl+E"),
+        ("Create Backup...", "create_backup", None),
+        ("-", None, None),
+        ("Revert to Original SSH Config", "revert_ssh_config", None),
+        ("-", None, None),
+        ("Exit", "_on_close", "Ctrl+Q"),
+    )),
+    ("View", (
+        ("Refresh", "load_connections", "F5"),
+        ("Expand All", "expand_all", None),
+        ("Collapse All", "collapse_all", None),
+    )),
+    ("Help", (
+        ("About", "show_about", None),
+    )),
+)
+
+# Keyboard shortcuts: (event sequence, method name)
+_KEY_BINDINGS = (
+    ("<Control-n>", "add_connection"),
+    ("<Control-e>", "export_connections"),
+    ("<Control-q>", "_on_close"),
+    ("<F5>", "_schedule_refresh"),
+)
+
+_ABOUT_TEXT = """SSH Manager v0.2.0
+
+A cross-platform GUI application for managing SSH configurations through organized folders and visual forms.
+
+Built with Python and Tkinter for maximum compatibility and minimal dependencies.
+
+Author: Jeremy
+License: MIT"""
+
+_DETAILS_TMPL = (
+    "Name: {name}\n"
+    "Group: {group}\n"
+    "Icon: {icon}\n\n"
+    "Configuration:\n"
+    + "-" * 40 + "\n"
+    "{config}"
+)
+
+# How often background jobs are checked for completion from the Tk thread
+_FUTURE_POLL_MS = 50
 
 
 class SSHManagerGUI:
@@ -29,6 +80,15 @@ class SSHManagerGUI:
             messagebox.showerror("Initialization Error", f"Failed to initialize SSH Manager: {e}")
             sys.exit(1)
             
+        # Pending Tk "after" callbacks used to coalesce bursts of events
+        self._refresh_after_id = None
+        self._details_after_id = None
+        
+        # Long-lived worker threads for blocking I/O (backups, connection
+        # tests) so Tk stays responsive
+        self._io_pool = ThreadPoolExecutor(max_workers=4, thread_name_prefix="sshmgr-io")
+        self.root.protocol("WM_DELETE_WINDOW", self._on_close)
+        
         self.setup_window()
         self.create_menu()
         self.create_widgets()
@@ -41,11 +101,11 @@ class SSHManagerGUI:
         self.root.minsize(600, 400)
         
         # Set icon (if available)
-        icon_path = Path(__file__).parent.parent.parent.parent / "assets" / "icons" / "icon.png"
-        if icon_path.exists():
+        if _ICON_PATH.exists():
             try:
-                # For Linux systems
-                self.root.iconphoto(True, tk.PhotoImage(file=str(icon_path)))
+                # For Linux systems; keep a reference so the image isn't collected
+                self._icon_image = tk.PhotoImage(file=str(_ICON_PATH))
+                self.root.iconphoto(True, self._icon_image)
             except:
                 pass  # Icon loading failed, continue without
                 
@@ -58,36 +118,21 @@ class SSHManagerGUI:
         menubar = tk.Menu(self.root)
         self.root.config(menu=menubar)
         
-        # File menu
-        file_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="File", menu=file_menu)
-        file_menu.add_command(label="Add Connection...", command=self.add_connection, accelerator="Ctrl+N")
-        file_menu.add_separator()
-        file_menu.add_command(label="Export Connections...", command=self.export_connections, accelerator="Ctrl+E")
-        file_menu.add_command(label="Create Backup...", command=self.create_backup)
-        file_menu.add_separator()
-        file_menu.add_command(label="Revert to Original SSH Config", command=self.revert_ssh_config)
-        file_menu.add_separator()
-        file_menu.add_command(label="Exit", command=self.root.quit, accelerator="Ctrl+Q")
-        
-        # View menu
-        view_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="View", menu=view_menu)
-        view_menu.add_command(label="Refresh", command=self.load_connections, accelerator="F5")
-        view_menu.add_command(label="Expand All", command=self.expand_all)
-        view_menu.add_command(label="Collapse All", command=self.collapse_all)
-        
-        # Help menu
-        help_menu = tk.Menu(menubar, tearoff=0)
-        menubar.add_cascade(label="Help", menu=help_menu)
-        help_menu.add_command(label="About", command=self.show_about)
-        
+        for menu_label, items in _MENU_SPEC:
+            menu = tk.Menu(menubar, tearoff=0)
+            menubar.add_cascade(label=menu_label, menu=menu)
+            
+            for label, method_name, accelerator in items:
+                if label == "-":
+                    menu.add_separator()
+                else:
+                    menu.add_command(label=label, command=getattr(self, method_name), accelerator=accelerator or "")
+                    
         # Bind keyboard shortcuts
-        self.root.bind_all("<Control-n>", lambda e: self.add_connection())
-        self.root.bind_all("<Control-e>", lambda e: self.export_connections())
-        self.root.bind_all("<Control-q>", lambda e: self.root.quit())
-        self.root.bind_all("<F5>", lambda e: self.load_connections())
-        
+        for sequence, method_name in _KEY_BINDINGS:
+            handler = getattr(self, method_name)
+            self.root.bind_all(sequence, lambda e, handler=handler: handler())
+            
     def create_widgets(self):
         """Create the main application widgets."""
         # Main container
@@ -131,6 +176,9 @@ class SSHManagerGUI:
         button_frame = ttk.Frame(right_frame)
         button_frame.grid(row=2, column=0, columnspan=2, sticky="ew", padx=5, pady=10)
         
+        # Shared state for the buttons that need a selected connection
+        self._selection_state = tk.StringVar(value="disabled")
+        
         self.connect_btn = ttk.Button(button_frame, text="Connect", command=self.connect_to_selected, state="disabled")
         self.connect_btn.pack(side="left", padx=(0, 5))
         
@@ -143,6 +191,9 @@ class SSHManagerGUI:
         self.delete_btn = ttk.Button(button_frame, text="Delete", command=self.delete_selected, state="disabled")
         self.delete_btn.pack(side="left")
         
+        self._action_buttons = (self.connect_btn, self.test_btn, self.edit_btn, self.delete_btn)
+        self._selection_state.trace_add("write", self._on_selection_state_changed)
+        
         # Add connection button
         add_frame = ttk.Frame(right_frame)
         add_frame.grid(row=3, column=0, columnspan=2, sticky="ew", padx=5, pady=5)
@@ -161,7 +212,19 @@ class SSHManagerGUI:
         """Load and display all connections."""
         try:
             connections = self.ssh_manager.list_connections()
-            self.tree_view.load_connections(connections)
+            
+            # Group in Python (the backend returns them sorted) so the tree only has to insert
+            groups = {}
+            for connection in connections:
+                groups.setdefault(connection['group'], []).append(connection)
+                
+            # Unmap the tree while inserting so Tk lays it out once at the end
+            self.tree_view.grid_remove()
+            try:
+                self.tree_view.load_connections(groups)
+            finally:
+                self.tree_view.grid()
+                
             self.update_details("")
         except Exception as e:
             messagebox.showerror("Error", f"Failed to load connections: {e}")
@@ -170,33 +233,54 @@ class SSHManagerGUI:
         """Handle connection selection."""
         self.selected_connection = connection_info
         
-        if connection_info:
-            # Enable action buttons
-            self.connect_btn.config(state="normal")
-            self.test_btn.config(state="normal") 
-            self.edit_btn.config(state="normal")
-            self.delete_btn.config(state="normal")
+        # Only touch the buttons when their state actually flips
+        state = "normal" if connection_info else "disabled"
+        if self._selection_state.get() != state:
+            self._selection_state.set(state)
             
+        if connection_info:
             # Update details panel
-            details = f"Name: {connection_info['name']}\n"
-            details += f"Group: {connection_info['group']}\n"
-            details += f"Icon: {connection_info['icon']}\n\n"
-            details += "Configuration:\n"
-            details += "-" * 40 + "\n"
-            details += connection_info.get('config', 'No configuration available')
+            details = _DETAILS_TMPL.format_map({
+                'name': connection_info['name'],
+                'group': connection_info['group'],
+                'icon': connection_info['icon'],
+                # Filled in by list_connections from the config cache; no I/O here
+                'config': connection_info.get('config') or 'No configuration available'
+            })
             
-            self.update_details(details)
+            self._schedule_details(details)
         else:
-            # Disable action buttons
-            self.connect_btn.config(state="disabled")
-            self.test_btn.config(state="disabled")
-            self.edit_btn.config(state="disabled")
-            self.delete_btn.config(state="disabled")
+            self._schedule_details("")
             
-            self.update_details("")
+    def _on_selection_state_changed(self, *_):
+        """Apply the selection state to the action buttons."""
+        state = self._selection_state.get()
+        for button in self._action_buttons:
+            button.config(state=state)
             
+    def _schedule_refresh(self):
+        """Reload connections once a burst of refresh requests settles."""
+        if self._refresh_after_id is not None:
+            self.root.after_cancel(self._refresh_after_id)
+        self._refresh_after_id = self.root.after(150, self._run_scheduled_refresh)
+        
+    def _run_scheduled_refresh(self):
+        self._refresh_after_id = None
+        self.load_connections()
+        
+    def _schedule_details(self, text):
+        """Update the details panel once selection changes settle."""
+        if self._details_after_id is not None:
+            self.root.after_cancel(self._details_after_id)
+        self._details_after_id = self.root.after(50, self.update_details, text)
+        
     def update_details(self, text):
         """Update the details text area."""
+        if self._details_after_id is not None:
+            # A direct update supersedes any scheduled one
+            self.root.after_cancel(self._details_after_id)
+            self._details_after_id = None
+            
         self.details_text.config(state="normal")
         self.details_text.delete(1.0, tk.END)
         self.details_text.insert(1.0, text)
@@ -204,6 +288,8 @@ class SSHManagerGUI:
         
     def add_connection(self):
         """Open add connection dialog."""
+        from .dialogs.add_connection import AddConnectionDialog
+        
         dialog = AddConnectionDialog(self.root, self.ssh_manager)
         if dialog.result:
             self.load_connections()  # Refresh the tree
@@ -213,6 +299,8 @@ class SSHManagerGUI:
         if not self.selected_connection:
             return
             
+        from .dialogs.edit_connection import EditConnectionDialog
+        
         dialog = EditConnectionDialog(self.root, self.ssh_manager, self.selected_connection)
         if dialog.result:
             self.load_connections()  # Refresh the tree
@@ -244,11 +332,29 @@ class SSHManagerGUI:
         if not self.selected_connection:
             return
             
+        future = self._io_pool.submit(
+            self.ssh_manager.test_connection,
+            self.selected_connection['name'],
+            self.selected_connection['group']
+        )
+        
+        self._when_done(future, self._show_test_result)
+        
+    def _when_done(self, future, callback, *args):
+        """Call callback(future, *args) on the Tk thread once future finishes.
+
+        The future is polled from Tk rather than using add_done_callback, so
+        worker threads never touch Tk, even after the window is destroyed.
+        """
+        if future.done():
+            callback(future, *args)
+        else:
+            self.root.after(_FUTURE_POLL_MS, self._when_done, future, callback, *args)
+        
+    def _show_test_result(self, future):
+        """Report the result of a background connection test."""
         try:
-            result = self.ssh_manager.test_connection(
-                self.selected_connection['name'],
-                self.selected_connection['group']
-            )
+            result = future.result()
             
             if result['success']:
                 messagebox.showinfo("Test Successful", result['message'])
@@ -291,25 +397,59 @@ class SSHManagerGUI:
         )
         
         if filename:
-            try:
-                result = self.ssh_manager.create_backup(filename)
-                if result['success']:
-                    messagebox.showinfo("Success", f"Connections exported to {filename}")
-                else:
-                    messagebox.showerror("Export Failed", result['error'])
-            except Exception as e:
-                messagebox.showerror("Error", f"Failed to export connections: {e}")
+            self.run_backup(
+                filename,
+                "Connections exported to {backup_path}",
+                "Export Failed",
+                "Failed to export connections"
+            )
                 
     def create_backup(self):
         """Create a backup of SSH Manager configurations."""
+        self.run_backup(
+            None,
+            "Backup created at {backup_path}",
+            "Backup Failed",
+            "Failed to create backup"
+        )
+        
+    def run_backup(self, backup_path, success_message, failure_title, error_message):
+        """Create a backup in the background while showing a progress dialog."""
+        progress = tk.Toplevel(self.root)
+        progress.title("Please Wait")
+        progress.resizable(False, False)
+        progress.transient(self.root)
+        # The dialog stays up until the backup finishes
+        progress.protocol("WM_DELETE_WINDOW", lambda: None)
+        
+        ttk.Label(progress, text="Creating backup...").pack(padx=20, pady=(15, 5))
+        progress_bar = ttk.Progressbar(progress, mode="indeterminate", length=250)
+        progress_bar.pack(padx=20, pady=(5, 15))
+        progress_bar.start(10)
+        progress.grab_set()
+        
+        future = self._io_pool.submit(self.ssh_manager.create_backup, backup_path)
+        
+        self._when_done(
+            future, self._show_backup_result, progress, progress_bar,
+            success_message, failure_title, error_message
+        )
+        
+    def _show_backup_result(self, future, progress, progress_bar, success_message, failure_title, error_message):
+        """Close the progress dialog and report the backup result."""
+        if progress.winfo_exists():
+            progress_bar.stop()
+            progress.grab_release()
+            progress.destroy()
+        
         try:
-            result = self.ssh_manager.create_backup()
+            result = future.result()
             if result['success']:
-                messagebox.showinfo("Success", f"Backup created at {result['backup_path']}")
+                messagebox.showinfo("Success", success_message.format(backup_path=result['backup_path']))
             else:
-                messagebox.showerror("Backup Failed", result['error'])
+                messagebox.showerror(failure_title, result['error'])
         except Exception as e:
-            messagebox.showerror("Error", f"Failed to create backup: {e}")
+            messagebox.showerror("Error", f"{error_message}: {e}")
             
     def revert_ssh_config(self):
         """Revert to original SSH configuration."""
@@ -339,15 +479,19 @@ class SSHManagerGUI:
         
     def show_about(self):
         """Show about dialog."""
-        about_text = """SSH Manager v0.2.0
-
-A cross-platform GUI application for managing SSH configurations through organized folders and visual forms.
-
-Built with Python and Tkinter for maximum compatibility and minimal dependencies.
+        messagebox.showinfo("About SSH Manager", _ABOUT_TEXT)
+        
+    def _on_close(self):
+        """Close the window and cancel queued background work.
 
-Author: Jeremy
-License: MIT"""
-        messagebox.showinfo("About SSH Manager", about_text)
+        Jobs already running (a backup, or a connection test bounded by its
+        connect timeout) still finish before the process exits.
+        """
+        if sys.version_info >= (3, 9):
+            self._io_pool.shutdown(wait=False, cancel_futures=True)
+        else:
+            self._io_pool.shutdown(wait=False)
+        self.root.destroy()
         
     def run(self):
         """Start the main event loop."""
@@ -8,162 +8,206 @@ This module provides both CLI and GUI entry points for the SSH Manager applicati
 
 import sys
 import argparse
-from pathlib import Path
 
-# Add the current directory to Python path
-sys.path.insert(0, str(Path(__file__).parent))
+from .backend.ssh_manager import SSHManager
 
-from backend.ssh_manager import SSHManager
+# GUI class, imported on first use so CLI commands never load tkinter
+_GUI_CLASS = None
 
 
-def cli_main():
-    """Command-line interface main function."""
-    parser = argparse.ArgumentParser(description='SSH Manager - Manage SSH connections through organized folders')
+def _add_add_arguments(parser):
+    parser.add_argument('-n', '--name', required=True, help='Connection name')
+    parser.add_argument('--host', required=True, help='Hostname or IP address')
+    parser.add_argument('-u', '--user', help='Username')
+    parser.add_argument('-p', '--port', default='22', help='Port (default: 22)')
+    parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
+    parser.add_argument('-t', '--template', default='basic-server', help='Template (default: basic-server)')
+    parser.add_argument('-k', '--key-file', default='~/.ssh/id_ed25519', help='SSH key file')
+
+
+def _add_list_arguments(parser):
+    parser.add_argument('-g', '--group', help='Filter by group')
+
+
+def _add_named_connection_arguments(parser):
+    parser.add_argument('name', help='Connection name')
+    parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
+
+
+def _add_backup_arguments(parser):
+    parser.add_argument('-o', '--output', help='Output file path')
+
+
+# Subcommand name -> (help text, argument builder)
+SUBCOMMANDS = {
+    'init': ('Initialize SSH Manager', None),
+    'add': ('Add new SSH connection', _add_add_arguments),
+    'list': ('List SSH connections', _add_list_arguments),
+    'remove': ('Remove SSH connection', _add_named_connection_arguments),
+    'test': ('Test SSH connection', _add_named_connection_arguments),
+    'connect': ('Connect to SSH server', _add_named_connection_arguments),
+    'groups': ('List all groups', None),
+    'backup': ('Create backup of configurations', _add_backup_arguments),
+    'gui': ('Launch GUI interface', None),
+}
+
+
+def build_parser(argv=None):
+    """
+    Build the CLI argument parser.
     
+    Only the subparser for the requested command is registered; the full
+    tree is built for --help, no command or an unknown command.
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+        
+    parser = argparse.ArgumentParser(description='SSH Manager - Manage SSH connections through organized folders')
     subparsers = parser.add_subparsers(dest='command', help='Available commands')
     
-    # Init command
-    init_parser = subparsers.add_parser('init', help='Initialize SSH Manager')
-    
-    # Add command
-    add_parser = subparsers.add_parser('add', help='Add new SSH connection')
-    add_parser.add_argument('-n', '--name', required=True, help='Connection name')
-    add_parser.add_argument('--host', required=True, help='Hostname or IP address')
-    add_parser.add_argument('-u', '--user', help='Username')
-    add_parser.add_argument('-p', '--port', default='22', help='Port (default: 22)')
-    add_parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
-    add_parser.add_argument('-t', '--template', default='basic-server', help='Template (default: basic-server)')
-    add_parser.add_argument('-k', '--key-file', default='~/.ssh/id_ed25519', help='SSH key file')
-    
-    # List command
-    list_parser = subparsers.add_parser('list', help='List SSH connections')
-    list_parser.add_argument('-g', '--group', help='Filter by group')
-    
-    # Remove command
-    remove_parser = subparsers.add_parser('remove', help='Remove SSH connection')
-    remove_parser.add_argument('name', help='Connection name')
-    remove_parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
+    requested = argv[0] if argv else None
+    if requested in SUBCOMMANDS:
+        names = [requested]
+    else:
+        names = list(SUBCOMMANDS)
+        
+    for name in names:
+        help_text, add_arguments = SUBCOMMANDS[name]
+        subparser = subparsers.add_parser(name, help=help_text)
+        if add_arguments:
+            add_arguments(subparser)
+            
+    return parser
+
+
+def _cmd_init(ssh_manager, args):
+    print("✅ SSH Manager initialized successfully")
+
+
+def _cmd_add(ssh_manager, args):
+    options = {
+        'name': args.name,
+        'host': args.host,
+        'user': args.user,
+        'port': args.port,
+        'group': args.group,
+        'template': args.template,
+        'key_file': args.key_file
+    }
+    ssh_manager.add_connection(options)
+    print(f"✅ Connection '{args.name}' added to group '{args.group}'")
+
+
+def _cmd_list(ssh_manager, args):
+    connections = ssh_manager.list_connections(args.group)
     
-    # Test command
-    test_parser = subparsers.add_parser('test', help='Test SSH connection')
-    test_parser.add_argument('name', help='Connection name')
-    test_parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
+    if not connections:
+        print("No connections found")
+        return
+        
+    # Build the whole listing and write it in one go
+    out = [f"\n📋 SSH Connections ({len(connections)} found):", "-" * 60]
     
-    # Connect command
-    connect_parser = subparsers.add_parser('connect', help='Connect to SSH server')
-    connect_parser.add_argument('name', help='Connection name')
-    connect_parser.add_argument('-g', '--group', default='personal', help='Group (default: personal)')
+    current_group = None
+    for conn in connections:  # already sorted by (group, name)
+        if conn['group'] != current_group:
+            current_group = conn['group']
+            out.append(f"\n📁 Group: {current_group}")
+            
+        out.append(f"  {conn['icon']} {conn['name']}")
+        
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _cmd_remove(ssh_manager, args):
+    ssh_manager.remove_connection(args.name, args.group)
+    print(f"✅ Connection '{args.name}' removed from group '{args.group}'")
+
+
+def _cmd_test(ssh_manager, args):
+    result = ssh_manager.test_connection(args.name, args.group)
     
-    # Groups command
-    groups_parser = subparsers.add_parser('groups', help='List all groups')
+    if result['success']:
+        print(f"✅ Connection test successful: {result['message']}")
+    else:
+        print(f"❌ Connection test failed: {result['error']}")
+        sys.exit(1)
+
+
+def _cmd_connect(ssh_manager, args):
+    result = ssh_manager.connect_to_server(args.name, args.group)
     
-    # Backup command
-    backup_parser = subparsers.add_parser('backup', help='Create backup of configurations')
-    backup_parser.add_argument('-o', '--output', help='Output file path')
+    if result['success']:
+        print(f"🔗 {result['message']}")
+        if 'command' in result:
+            print(f"Command: {result['command']}")
+    else:
+        print(f"❌ Connection failed: {result['error']}")
+        sys.exit(1)
+
+
+def _cmd_groups(ssh_manager, args):
+    groups = ssh_manager.get_groups()
     
-    # GUI command
-    gui_parser = subparsers.add_parser('gui', help='Launch GUI interface')
+    if not groups:
+        print("No groups found")
+        return
+        
+    # One pass over all connections instead of a listing per group
+    counts = {}
+    for conn in ssh_manager.list_connections():
+        counts[conn['group']] = counts.get(conn['group'], 0) + 1
+        
+    out = [f"\n📁 Groups ({len(groups)} found):"]
+    for group in sorted(groups):
+        out.append(f"  📂 {group} ({counts.get(group, 0)} connections)")
+        
+    sys.stdout.write("\n".join(out) + "\n")
+
+
+def _cmd_backup(ssh_manager, args):
+    result = ssh_manager.create_backup(args.output)
     
+    if result['success']:
+        print(f"✅ Backup created: {result['backup_path']}")
+    else:
+        print(f"❌ Backup failed: {result['error']}")
+        sys.exit(1)
+
+
+HANDLERS = {
+    'init': _cmd_init,
+    'add': _cmd_add,
+    'list': _cmd_list,
+    'remove': _cmd_remove,
+    'test': _cmd_test,
+    'connect': _cmd_connect,
+    'groups': _cmd_groups,
+    'backup': _cmd_backup,
+}
+
+
+def cli_main():
+    """Command-line interface main function."""
+    parser = build_parser()
     args = parser.parse_args()
     
     if not args.command:
         parser.print_help()
         return
         
-    # Initialize SSH Manager
-    ssh_manager = SSHManager()
-    
+    if args.command == 'gui':
+        # The GUI initializes its own SSH Manager instance
+        launch_gui()
+        return
+        
     try:
-        if args.command == 'init':
-            ssh_manager.init()
-            print("✅ SSH Manager initialized successfully")
-            
-        elif args.command == 'add':
-            ssh_manager.init()  # Ensure initialized
-            options = {
-                'name': args.name,
-                'host': args.host,
-                'user': args.user,
-                'port': args.port,
-                'group': args.group,
-                'template': args.template,
-                'key_file': args.key_file
-            }
-            result = ssh_manager.add_connection(options)
-            print(f"✅ Connection '{args.name}' added to group '{args.group}'")
-            
-        elif args.command == 'list':
-            ssh_manager.init()
-            connections = ssh_manager.list_connections(args.group)
-            
-            if not connections:
-                print("No connections found")
-                return
-                
-            print(f"\n📋 SSH Connections ({len(connections)} found):")
-            print("-" * 60)
-            
-            current_group = None
-            for conn in sorted(connections, key=lambda x: (x['group'], x['name'])):
-                if conn['group'] != current_group:
-                    current_group = conn['group']
-                    print(f"\n📁 Group: {current_group}")
-                    
-                print(f"  {conn['icon']} {conn['name']}")
-                
-        elif args.command == 'remove':
-            ssh_manager.init()
-            ssh_manager.remove_connection(args.name, args.group)
-            print(f"✅ Connection '{args.name}' removed from group '{args.group}'")
-            
-        elif args.command == 'test':
-            ssh_manager.init()
-            result = ssh_manager.test_connection(args.name, args.group)
-            
-            if result['success']:
-                print(f"✅ Connection test successful: {result['message']}")
-            else:
-                print(f"❌ Connection test failed: {result['error']}")
-                sys.exit(1)
-                
-        elif args.command == 'connect':
-            ssh_manager.init()
-            result = ssh_manager.connect_to_server(args.name, args.group)
-            
-            if result['success']:
-                print(f"🔗 {result['message']}")
-                if 'command' in result:
-                    print(f"Command: {result['command']}")
-            else:
-                print(f"❌ Connection failed: {result['error']}")
-                sys.exit(1)
-                
-        elif args.command == 'groups':
-            ssh_manager.init()
-            groups = ssh_manager.get_groups()
-            
-            if not groups:
-                print("No groups found")
-                return
-                
-            print(f"\n📁 Groups ({len(groups)} found):")
-            for group in sorted(groups):
-                connections = ssh_manager.list_connections(group)
-                print(f"  📂 {group} ({len(connections)} connections)")
-                
-        elif args.command == 'backup':
-            ssh_manager.init()
-            result = ssh_manager.create_backup(args.output)
-            
-            if result['success']:
-                print(f"✅ Backup created: {result['backup_path']}")
-            else:
-                print(f"❌ Backup failed: {result['error']}")
-                sys.exit(1)
-                
-        elif args.command == 'gui':
-            launch_gui()
-            
+        # Initialize SSH Manager once for every command
+        ssh_manager = SSHManager()
+        ssh_manager.init()
+        
+        HANDLERS[args.command](ssh_manager, args)
+        
     except KeyboardInterrupt:
         print("\n\n⏹️  SSH Manager terminated by user")
     except Exception as e:
@@ -173,11 +217,14 @@ def cli_main():
 
 def launch_gui():
     """Launch the GUI interface."""
+    global _GUI_CLASS
+    
     try:
-        from gui.main import SSHManagerGUI
-        
+        if _GUI_CLASS is None:
+            from .gui.main import SSHManagerGUI as _GUI_CLASS
+            
         print("🚀 Launching SSH Manager GUI...")
-        app = SSHManagerGUI()
+        app = _GUI_CLASS()
         app.run()
         
     except ImportError as e:
@@ -15,10 +15,11 @@ from pathlib import Path
 def main():
     """Main startup function."""
     # Get the directory where this script is located
-    script_dir = Path(__file__).parent
+    script_dir = Path(os.path.abspath(os.path.dirname(__file__)))
     
-    # Change to the SSH Manager directory
-    os.chdir(script_dir)
+    # Change to the SSH Manager directory (unless we're already there)
+    if os.getcwd() != str(script_dir):
+        os.chdir(script_dir)
     
     # Check if virtual environment exists
     venv_dir = script_dir / "venv"
@@ -32,11 +33,13 @@ def main():
         # Use system Python
         python_path = sys.executable
     
-    # SSH Manager main script path
-    main_script = script_dir / "src" / "ssh_manager" / "main.py"
+    # Make the ssh_manager package importable from the source tree
+    src_dir = str(script_dir / "src")
+    pythonpath = os.environ.get("PYTHONPATH")
+    os.environ["PYTHONPATH"] = src_dir + os.pathsep + pythonpath if pythonpath else src_dir
     
     # Build command
-    cmd = [str(python_path), str(main_script)]
+    cmd = [str(python_path), "-m", "ssh_manager.main"]
     
     # Add any command line arguments
     if len(sys.argv) > 1:
@@ -47,7 +50,11 @@ def main():
     
     # Execute SSH Manager
     try:
-        subprocess.run(cmd)
+        if os.name == 'nt':  # Windows
+            subprocess.run(cmd)
+        else:
+            # Replace this process instead of keeping a second interpreter around
+            os.execv(cmd[0], cmd)
     except KeyboardInterrupt:
         print("\nSSH Manager terminated by user")
     except FileNotFoundError:
@@ -10,14 +10,17 @@ from PySide6.QtWidgets import (
     QGroupBox, QLabel, QFileDialog, QListWidget,
     QListWidgetItem, QMessageBox
 )
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Signal
 from pathlib import Path
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from typing import List, Tuple
 
 from core.connection import Connection
 
+# Environment combo entries: index -> (label, color tag)
+_COLOR_LABELS = ("None", "🔴 Production", "🟡 Staging", "🟢 Development")
+_COLOR_INDEX_TO_TAG = ("", "production", "staging", "development")
+_COLOR_TAG_TO_INDEX = {"production": 1, "staging": 2, "development": 3}
+
 
 class PortForwardWidget(QListWidget):
     """Widget for managing port forwards (local or remote)."""
@@ -25,6 +28,7 @@ class PortForwardWidget(QListWidget):
     def __init__(self, forward_type="local", parent=None):
         super().__init__(parent)
         self.forward_type = forward_type  # "local" or "remote"
+        self._forwards: List[Tuple[int, str, int]] = []  # Parallel to the list rows
 
     def add_forward(self, local_port: int, remote_host: str, remote_port: int):
         """Add port forward to list."""
@@ -33,23 +37,24 @@ class PortForwardWidget(QListWidget):
         else:
             text = f"{local_port} ← {remote_host}:{remote_port}"
 
-        item = QListWidgetItem(text)
-        item.setData(Qt.UserRole, (local_port, remote_host, remote_port))
-        self.addItem(item)
+        self.addItem(QListWidgetItem(text))
+        self._forwards.append((local_port, remote_host, remote_port))
 
     def get_forwards(self):
         """Get all forwards as list of tuples."""
-        forwards = []
-        for i in range(self.count()):
-            item = self.item(i)
-            forwards.append(item.data(Qt.UserRole))
-        return forwards
+        return list(self._forwards)
 
     def remove_selected(self):
         """Remove selected forward."""
         current_row = self.currentRow()
         if current_row >= 0:
             self.takeItem(current_row)
+            self._forwards.pop(current_row)
+
+    def clear(self):
+        """Remove all forwards."""
+        super().clear()
+        self._forwards.clear()
 
 
 class ConnectionDialog(QDialog):
@@ -69,7 +74,54 @@ class ConnectionDialog(QDialog):
         self.folders = folders or ["work", "personal"]
         self.is_edit_mode = connection is not None
 
-        self.setup_ui()
+        # Widgets are built the first time the dialog is shown
+        self._ui_built = False
+        self._advanced_built = False
+
+        # Port forward dialogs, reused per forward type
+        self._forward_dialogs = {}
+
+    def setVisible(self, visible: bool):
+        """Build the UI on first show (show() and exec() both land here)."""
+        if visible and not self._ui_built:
+            self._ui_built = True
+            self.setup_ui()
+            self.load_connection_data()
+
+        super().setVisible(visible)
+
+    def reset_for(self, connection: Connection = None, folders: list = None):
+        """
+        Re-target the dialog at another connection so it can be reused.
+
+        Args:
+            connection: Connection to edit, or None for a new connection
+            folders: Folder paths offered in the folder combo
+        """
+        self.connection = connection
+        self.folders = folders or ["work", "personal"]
+        self.is_edit_mode = connection is not None
+
+        if not self._ui_built:
+            # setup_ui will pick up the new values on first show
+            return
+
+        self.setWindowTitle("Edit Connection" if self.is_edit_mode else "New Connection")
+
+        # Clear the form
+        self.name_input.clear()
+        self.hostname_input.clear()
+        self.user_input.clear()
+        self.port_input.setValue(22)
+        self.key_input.clear()
+        self.folder_combo.clear()
+        self.folder_combo.addItems(self.folders)
+        self.color_combo.setCurrentIndex(0)
+        if self._advanced_built:
+            self.jump_input.clear()
+            self.local_forwards_widget.clear()
+            self.remote_forwards_widget.clear()
+
         self.load_connection_data()
 
     def setup_ui(self):
@@ -125,30 +177,66 @@ class ConnectionDialog(QDialog):
 
         # Color Tag
         self.color_combo = QComboBox()
-        self.color_combo.addItems(["None", "🔴 Production", "🟡 Staging", "🟢 Development"])
+        for label, tag in zip(_COLOR_LABELS, _COLOR_INDEX_TO_TAG):
+            self.color_combo.addItem(label, tag)
         basic_layout.addRow("Environment:", self.color_combo)
 
         basic_group.setLayout(basic_layout)
         layout.addWidget(basic_group)
 
-        # Advanced Settings
+        # Advanced Settings (contents built on first expand)
         advanced_group = QGroupBox("Advanced Settings")
-        advanced_layout = QVBoxLayout()
+        self.advanced_layout = QVBoxLayout()
+
+        self.advanced_toggle_btn = QPushButton("Show advanced ▾")
+        self.advanced_toggle_btn.clicked.connect(self.build_advanced_settings)
+        self.advanced_layout.addWidget(self.advanced_toggle_btn)
+
+        advanced_group.setLayout(self.advanced_layout)
+        layout.addWidget(advanced_group)
+
+        # Buttons
+        button_layout = QHBoxLayout()
+        button_layout.addStretch()
+
+        self.cancel_btn = QPushButton("Cancel")
+        self.cancel_btn.clicked.connect(self.reject)
+
+        self.test_btn = QPushButton("Test")
+        self.test_btn.clicked.connect(self.test_connection)
+
+        self.save_btn = QPushButton("Save")
+        self.save_btn.clicked.connect(self.save_connection)
+        self.save_btn.setDefault(True)
+
+        button_layout.addWidget(self.cancel_btn)
+        button_layout.addWidget(self.test_btn)
+        button_layout.addWidget(self.save_btn)
+
+        layout.addLayout(button_layout)
+
+    def build_advanced_settings(self):
+        """Build the advanced settings (jump host, port forwards) once."""
+        if self._advanced_built:
+            return
+        self._advanced_built = True
+
+        self.advanced_toggle_btn.hide()
 
         # Jump Host
         jump_form = QFormLayout()
         self.jump_input = QLineEdit()
         self.jump_input.setPlaceholderText("e.g., bastion.company.com")
         jump_form.addRow("Jump Host (ProxyJump):", self.jump_input)
-        advanced_layout.addLayout(jump_form)
+        self.advanced_layout.addLayout(jump_form)
 
         # Local Port Forwards
         local_forward_label = QLabel("Local Port Forwards:")
-        advanced_layout.addWidget(local_forward_label)
+        self.advanced_layout.addWidget(local_forward_label)
 
         self.local_forwards_widget = PortForwardWidget("local")
         self.local_forwards_widget.setMaximumHeight(80)
-        advanced_layout.addWidget(self.local_forwards_widget)
+        self.advanced_layout.addWidget(self.local_forwards_widget)
 
         local_forward_btn_layout = QHBoxLayout()
         self.add_local_forward_btn = QPushButton("+ Add Local Forward")
@@ -160,15 +248,15 @@ class ConnectionDialog(QDialog):
         local_forward_btn_layout.addWidget(self.add_local_forward_btn)
         local_forward_btn_layout.addWidget(self.remove_local_forward_btn)
         local_forward_btn_layout.addStretch()
-        advanced_layout.addLayout(local_forward_btn_layout)
+        self.advanced_layout.addLayout(local_forward_btn_layout)
 
         # Remote Port Forwards
         remote_forward_label = QLabel("Remote Port Forwards:")
-        advanced_layout.addWidget(remote_forward_label)
+        self.advanced_layout.addWidget(remote_forward_label)
 
         self.remote_forwards_widget = PortForwardWidget("remote")
         self.remote_forwards_widget.setMaximumHeight(80)
-        advanced_layout.addWidget(self.remote_forwards_widget)
+        self.advanced_layout.addWidget(self.remote_forwards_widget)
 
         remote_forward_btn_layout = QHBoxLayout()
         self.add_remote_forward_btn = QPushButton("+ Add Remote Forward")
@@ -180,30 +268,7 @@ class ConnectionDialog(QDialog):
         remote_forward_btn_layout.addWidget(self.add_remote_forward_btn)
         remote_forward_btn_layout.addWidget(self.remove_remote_forward_btn)
         remote_forward_btn_layout.addStretch()
-        advanced_layout.addLayout(remote_forward_btn_layout)
-
-        advanced_group.setLayout(advanced_layout)
-        layout.addWidget(advanced_group)
-
-        # Buttons
-        button_layout = QHBoxLayout()
-        button_layout.addStretch()
-
-        self.cancel_btn = QPushButton("Cancel")
-        self.cancel_btn.clicked.connect(self.reject)
-
-        self.test_btn = QPushButton("Test")
-        self.test_btn.clicked.connect(self.test_connection)
-
-        self.save_btn = QPushButton("Save")
-        self.save_btn.clicked.connect(self.save_connection)
-        self.save_btn.setDefault(True)
-
-        button_layout.addWidget(self.cancel_btn)
-        button_layout.addWidget(self.test_btn)
-        button_layout.addWidget(self.save_btn)
-
-        layout.addLayout(button_layout)
+        self.advanced_layout.addLayout(remote_forward_btn_layout)
 
     def load_connection_data(self):
         """Load existing connection data into form (edit mode)."""
@@ -219,16 +284,19 @@ class ConnectionDialog(QDialog):
         self.port_input.setValue(self.connection.port)
         self.key_input.setText(self.connection.identity_file)
         self.folder_combo.setCurrentText(self.connection.folder)
-        self.jump_input.setText(self.connection.proxy_jump)
 
         # Set color tag
-        color_map = {
-            "production": 1,
-            "staging": 2,
-            "development": 3
-        }
-        color_index = color_map.get(self.connection.color_tag, 0)
-        self.color_combo.setCurrentIndex(color_index)
+        self.color_combo.setCurrentIndex(_COLOR_TAG_TO_INDEX.get(self.connection.color_tag, 0))
+
+        # Advanced settings are only built when there is something to show
+        if (self.connection.proxy_jump or self.connection.local_forwards
+                or self.connection.remote_forwards):
+            self.build_advanced_settings()
+
+        if not self._advanced_built:
+            return
+
+        self.jump_input.setText(self.connection.proxy_jump)
 
         # Load port forwards
         for local_port, remote_host, remote_port in self.connection.local_forwards:
@@ -250,16 +318,26 @@ class ConnectionDialog(QDialog):
         if file_path:
             self.key_input.setText(file_path)
 
+    def get_forward_dialog(self, forward_type: str) -> "PortForwardDialog":
+        """Get the (reused) port forward dialog for a forward type, reset to defaults."""
+        dialog = self._forward_dialogs.get(forward_type)
+        if dialog is None:
+            dialog = PortForwardDialog(self, forward_type)
+            self._forward_dialogs[forward_type] = dialog
+        else:
+            dialog.reset()
+        return dialog
+
     def add_local_forward(self):
         """Add local port forward."""
-        dialog = PortForwardDialog(self, "local")
+        dialog = self.get_forward_dialog("local")
         if dialog.exec() == QDialog.Accepted:
             local_port, remote_host, remote_port = dialog.get_forward()
             self.local_forwards_widget.add_forward(local_port, remote_host, remote_port)
 
     def add_remote_forward(self):
         """Add remote port forward."""
-        dialog = PortForwardDialog(self, "remote")
+        dialog = self.get_forward_dialog("remote")
         if dialog.exec() == QDialog.Accepted:
             remote_port, local_host, local_port = dialog.get_forward()
             self.remote_forwards_widget.add_forward(remote_port, local_host, local_port)
@@ -281,16 +359,19 @@ class ConnectionDialog(QDialog):
         port = self.port_input.value()
         identity_file = self.key_input.text().strip()
         folder = self.folder_combo.currentText().strip()
-        proxy_jump = self.jump_input.text().strip()
 
         # Get color tag
-        color_index = self.color_combo.currentIndex()
-        color_map = ["", "production", "staging", "development"]
-        color_tag = color_map[color_index]
+        color_tag = self.color_combo.currentData()
 
-        # Get port forwards
-        local_forwards = self.local_forwards_widget.get_forwards()
-        remote_forwards = self.remote_forwards_widget.get_forwards()
+        # Get jump host and port forwards (empty if never expanded)
+        if self._advanced_built:
+            proxy_jump = self.jump_input.text().strip()
+            local_forwards = self.local_forwards_widget.get_forwards()
+            remote_forwards = self.remote_forwards_widget.get_forwards()
+        else:
+            proxy_jump = ""
+            local_forwards = []
+            remote_forwards = []
 
         # Create connection object
         connection = Connection(
@@ -347,24 +428,18 @@ class PortForwardDialog(QDialog):
         # Form
         form = QFormLayout()
 
+        self.port1_input = QSpinBox()
+        self.port1_input.setRange(1, 65535)
         if self.forward_type == "local":
-            self.port1_input = QSpinBox()
-            self.port1_input.setRange(1, 65535)
-            self.port1_input.setValue(8080)
             form.addRow("Local Port:", self.port1_input)
         else:
-            self.port1_input = QSpinBox()
-            self.port1_input.setRange(1, 65535)
-            self.port1_input.setValue(3000)
             form.addRow("Remote Port:", self.port1_input)
 
         self.host_input = QLineEdit()
-        self.host_input.setText("localhost")
         form.addRow("Host:", self.host_input)
 
         self.port2_input = QSpinBox()
         self.port2_input.setRange(1, 65535)
-        self.port2_input.setValue(80 if self.forward_type == "local" else 3000)
 
         if self.forward_type == "local":
             form.addRow("Remote Port:", self.port2_input)
@@ -389,6 +464,18 @@ class PortForwardDialog(QDialog):
 
         layout.addLayout(button_layout)
 
+        self.reset()
+
+    def reset(self):
+        """Reset fields to their defaults."""
+        if self.forward_type == "local":
+            self.port1_input.setValue(8080)
+            self.port2_input.setValue(80)
+        else:
+            self.port1_input.setValue(3000)
+            self.port2_input.setValue(3000)
+        self.host_input.setText("localhost")
+
     def get_forward(self):
         """Get port forward tuple."""
         port1 = self.port1_input.value()
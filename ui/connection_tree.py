@@ -1,53 +1,476 @@
 """
 Connection Tree View
 
-Tree widget displaying folders and connections in hierarchical structure.
+Tree view displaying folders and connections in hierarchical structure.
 """
 
-from PySide6.QtWidgets import QTreeWidget, QTreeWidgetItem, QMenu
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import QTreeView, QMenu, QAbstractItemView
+from PySide6.QtCore import (
+    Qt, Signal, QAbstractItemModel, QModelIndex, QSortFilterProxyModel
+)
 from PySide6.QtGui import QAction
-from pathlib import Path
-from typing import List, Optional
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from dataclasses import dataclass, field
+from typing import ClassVar, Dict, List, Optional, Tuple, Union
 
 from core.connection import Connection
 
+_FOLDER_PREFIX = "📁 "
+
+
+def search_blob(connection: Connection) -> str:
+    """
+    Build the lowercase text that search queries are matched against.
+
+    Args:
+        connection: Connection to index
+
+    Returns:
+        Name, hostname, user and folder, lowercased and newline-separated
+    """
+    return f"{connection.name}\n{connection.hostname}\n{connection.user}\n{connection.folder}".lower()
+
+
+@dataclass(eq=False)
+class ConnectionTreeItem:
+    """Tree node for a connection."""
+
+    connection: Connection
+    parent: "FolderTreeItem" = field(repr=False)
+    row: int = 0
+
+    # Lowercased name/hostname/user/folder, matched against search text
+    search_blob: str = field(init=False, repr=False)
+
+    is_connection: ClassVar[bool] = True
 
-class ConnectionTreeItem(QTreeWidgetItem):
-    """Custom tree widget item for connections."""
+    def __post_init__(self):
+        self.update_search_blob()
 
-    def __init__(self, parent, connection: Connection):
+    def update_search_blob(self):
+        """Recompute search_blob from the connection's fields."""
+        self.search_blob = search_blob(self.connection)
+
+
+@dataclass(eq=False)
+class FolderTreeItem:
+    """Tree node for a folder (connections first, then subfolders)."""
+
+    folder_name: str
+    folder_path: str
+    parent: Optional["FolderTreeItem"] = field(default=None, repr=False)
+    row: int = 0
+    children: List[Union["FolderTreeItem", ConnectionTreeItem]] = field(default_factory=list, repr=False)
+
+    is_connection: ClassVar[bool] = False
+
+
+TreeItem = Union[ConnectionTreeItem, FolderTreeItem]
+
+
+class ConnectionTreeModel(QAbstractItemModel):
+    """
+    Item model exposing the folder/connection hierarchy to a QTreeView.
+
+    The node tree is built once per load; the view only asks for the rows
+    it actually displays. Single adds, edits and removals update the tree
+    in place.
+    """
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.connection = connection
-        self.is_connection = True
+        self._root = FolderTreeItem("", "")
+
+        # Lookups for in-place updates, keyed by folder path and (folder, name)
+        self._folder_items: Dict[str, FolderTreeItem] = {}
+        self._conn_items: Dict[Tuple[str, str], ConnectionTreeItem] = {}
+
+        # Connections of the last full load (None once edited in place)
+        self._loaded: Optional[List[Connection]] = None
+
+    def load_connections(self, connections: List[Connection]) -> bool:
+        """
+        Replace the model contents with a single reset.
+
+        Args:
+            connections: List of Connection objects
+
+        Returns:
+            False if the contents were unchanged and no reset was needed
+        """
+        if self._loaded is not None and connections == self._loaded:
+            return False
+
+        self.beginResetModel()
+        self._root = self._build_tree(connections)
+        self._loaded = list(connections)
+        self.endResetModel()
+
+        return True
+
+    def _build_tree(self, connections: List[Connection]) -> FolderTreeItem:
+        """
+        Build the node tree from a flat list of connections.
+
+        Args:
+            connections: List of Connection objects
+
+        Returns:
+            Invisible root folder node
+        """
+        root = FolderTreeItem("", "")
+        folder_items = self._folder_items = {}
+        conn_items = self._conn_items = {}
+
+        # Sorting by (folder parts, name) yields each folder's connections
+        # followed by its subfolders, so one pass can build the tree
+        ordered = sorted(
+            (conn for conn in connections if conn.folder),
+            key=lambda conn: (conn.folder_parts, conn.name)
+        )
+
+        # Open folders from the root down to the current leaf
+        stack = [root]
+
+        for conn in ordered:
+            parts = conn.folder_parts
+
+            # Keep the folders shared with the previous connection
+            depth = 0
+            while (depth < len(parts) and depth + 1 < len(stack)
+                   and stack[depth + 1].folder_name == parts[depth]):
+                depth += 1
+            del stack[depth + 1:]
+
+            # Open the remaining folders
+            for part in parts[depth:]:
+                parent = stack[-1]
+                folder_path = f"{parent.folder_path}/{part}" if parent is not root else part
+                folder = FolderTreeItem(part, folder_path, parent, len(parent.children))
+                parent.children.append(folder)
+                folder_items[folder_path] = folder
+                stack.append(folder)
+
+            leaf = stack[-1]
+            conn_item = ConnectionTreeItem(conn, leaf, len(leaf.children))
+            leaf.children.append(conn_item)
+            conn_items[(conn.folder, conn.name)] = conn_item
+
+        return root
+
+    def add_connection(self, connection: Connection) -> Optional[QModelIndex]:
+        """
+        Insert a connection at its sorted position, creating folders as needed.
+
+        Args:
+            connection: Connection to add
+
+        Returns:
+            Index of the new row, or None if the connection has no folder
+        """
+        if not connection.folder:
+            return None
+
+        self._loaded = None
+        parent = self._ensure_folder(connection.folder_parts)
+
+        # Connections come first in a folder, sorted by name
+        row = 0
+        for child in parent.children:
+            if not child.is_connection or child.connection.name > connection.name:
+                break
+            row += 1
+
+        item = ConnectionTreeItem(connection, parent, row)
+        self._insert_item(parent, row, item)
+        self._conn_items[(connection.folder, connection.name)] = item
+
+        return self.createIndex(item.row, 0, item)
+
+    def remove_connection(self, connection: Connection):
+        """
+        Remove a connection, along with any folders it leaves empty.
+
+        Args:
+            connection: Connection to remove
+        """
+        item = self._conn_items.pop((connection.folder, connection.name), None)
+        if item is None:
+            return
+
+        self._loaded = None
+
+        # Drop the highest ancestor that would be left without children
+        while item.parent is not self._root and len(item.parent.children) == 1:
+            item = item.parent
+
+        parent = item.parent
+        self.beginRemoveRows(self._index_for(parent), item.row, item.row)
+        del parent.children[item.row]
+        self._renumber(parent, item.row)
+        self.endRemoveRows()
+
+        if not item.is_connection:
+            self._forget_folder(item)
+
+    def update_connection(self, old: Connection, new: Connection) -> Optional[QModelIndex]:
+        """
+        Replace a connection, moving it only if its folder or name changed.
+
+        Args:
+            old: Connection currently in the model
+            new: Connection to show in its place
+
+        Returns:
+            Index of the updated row, or None if it is not shown
+        """
+        key = (old.folder, old.name)
+        item = self._conn_items.get(key)
+
+        if item is None or key != (new.folder, new.name):
+            self.remove_connection(old)
+            return self.add_connection(new)
+
+        self._loaded = None
+        item.connection = new
+        item.update_search_blob()
+        index = self.createIndex(item.row, 0, item)
+        self.dataChanged.emit(index, index)
+
+        return index
+
+    def _ensure_folder(self, parts: Tuple[str, ...]) -> FolderTreeItem:
+        """Get the folder node for a path, inserting missing folders."""
+        folder = self._root
+
+        for part in parts:
+            folder_path = f"{folder.folder_path}/{part}" if folder is not self._root else part
+            child = self._folder_items.get(folder_path)
+
+            if child is None:
+                # Subfolders follow the connections, sorted by name
+                row = len(folder.children)
+                for i, sibling in enumerate(folder.children):
+                    if not sibling.is_connection and sibling.folder_name > part:
+                        row = i
+                        break
+
+                child = FolderTreeItem(part, folder_path, folder, row)
+                self._insert_item(folder, row, child)
+                self._folder_items[folder_path] = child
+
+            folder = child
+
+        return folder
+
+    def _insert_item(self, parent: FolderTreeItem, row: int, item: TreeItem):
+        """Insert a node under parent at row, notifying views."""
+        self.beginInsertRows(self._index_for(parent), row, row)
+        parent.children.insert(row, item)
+        self._renumber(parent, row + 1)
+        self.endInsertRows()
+
+    def _forget_folder(self, folder: FolderTreeItem):
+        """Drop a removed folder's subtree from the lookup dicts."""
+        del self._folder_items[folder.folder_path]
+        for child in folder.children:
+            if child.is_connection:
+                conn = child.connection
+                self._conn_items.pop((conn.folder, conn.name), None)
+            else:
+                self._forget_folder(child)
+
+    @staticmethod
+    def _renumber(parent: FolderTreeItem, start: int):
+        """Refresh cached row numbers from start onwards."""
+        children = parent.children
+        for row in range(start, len(children)):
+            children[row].row = row
+
+    def _index_for(self, item: TreeItem) -> QModelIndex:
+        """Get the model index of a node (invalid for the root)."""
+        if item is self._root:
+            return QModelIndex()
+        return self.createIndex(item.row, 0, item)
+
+    @property
+    def root_item(self) -> FolderTreeItem:
+        """Invisible root folder node."""
+        return self._root
+
+    def folder_paths(self):
+        """Paths of all folder nodes."""
+        return self._folder_items.keys()
+
+    def folder_index(self, folder_path: str) -> QModelIndex:
+        """Get the model index of a folder (invalid if it is not shown)."""
+        folder = self._folder_items.get(folder_path)
+        if folder is None:
+            return QModelIndex()
+        return self.createIndex(folder.row, 0, folder)
+
+    def connection_item(self, connection: Connection) -> Optional[ConnectionTreeItem]:
+        """Get the node showing a connection (None if it is not shown)."""
+        return self._conn_items.get((connection.folder, connection.name))
+
+    def connection_items(self):
+        """All connection nodes, in no particular order."""
+        return self._conn_items.values()
+
+    def item(self, index: QModelIndex) -> Optional[TreeItem]:
+        """Get the tree node for a model index (None for the root)."""
+        if not index.isValid():
+            return None
+        return index.internalPointer()
+
+    def index(self, row: int, column: int, parent: QModelIndex = QModelIndex()) -> QModelIndex:
+        if not self.hasIndex(row, column, parent):
+            return QModelIndex()
+
+        parent_item = parent.internalPointer() if parent.isValid() else self._root
+        return self.createIndex(row, column, parent_item.children[row])
 
-        # Set display text with color emoji
-        self.setText(0, connection.get_display_name())
+    def parent(self, index: QModelIndex) -> QModelIndex:
+        if not index.isValid():
+            return QModelIndex()
 
-        # Store connection data
-        self.setData(0, Qt.UserRole, connection)
+        parent_item = index.internalPointer().parent
+        if parent_item is None or parent_item is self._root:
+            return QModelIndex()
 
+        return self.createIndex(parent_item.row, 0, parent_item)
 
-class FolderTreeItem(QTreeWidgetItem):
-    """Custom tree widget item for folders."""
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.column() > 0:
+            return 0
 
-    def __init__(self, parent, folder_name: str, folder_path: str):
+        parent_item = parent.internalPointer() if parent.isValid() else self._root
+        if parent_item.is_connection:
+            return 0
+
+        return len(parent_item.children)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        return 1
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        if not index.isValid():
+            return None
+
+        item = index.internalPointer()
+
+        if role == Qt.DisplayRole:
+            if item.is_connection:
+                # Display text with color emoji
+                return item.connection.get_display_name()
+            # Display text with folder emoji
+            return _FOLDER_PREFIX + item.folder_name
+
+        if role == Qt.UserRole:
+            return item.connection if item.is_connection else item.folder_path
+
+        return None
+
+
+class ConnectionFilterProxyModel(QSortFilterProxyModel):
+    """
+    Filters connections by search text.
+
+    Visibility is computed for the whole tree in one pass over the flat
+    list of connections per query: a folder is shown iff some connection
+    below it matches.
+    """
+
+    def __init__(self, parent=None):
         super().__init__(parent)
-        self.folder_name = folder_name
-        self.folder_path = folder_path
-        self.is_connection = False
+        self.search_text = ""
+
+        # Items that pass the current filter, and the root they were computed for
+        self._visible = set()
+        self._visible_root = None
+
+    def set_search_text(self, search_text: str):
+        """
+        Set the (case-insensitive) search text and re-filter.
+
+        Args:
+            search_text: Text to search for
+        """
+        self.search_text = search_text.lower()
+        self.refresh()
+
+    def set_matches(self, search_text: str, connections: List[Connection]):
+        """
+        Show only the given connections, already matched against search_text.
+
+        Args:
+            search_text: Search text the connections were matched against
+            connections: Matching connections
+        """
+        source_model = self.sourceModel()
+        items = filter(None, map(source_model.connection_item, connections))
+
+        self.search_text = search_text.lower()
+        self._visible = self._with_folders(source_model, items)
+        self._visible_root = source_model.root_item
+        self.invalidateFilter()
+
+    def refresh(self):
+        """Recompute visibility after the source tree changed in place."""
+        self._visible_root = None
+        self.invalidateFilter()
+
+    def filterAcceptsRow(self, source_row: int, source_parent: QModelIndex) -> bool:
+        if not self.search_text:
+            return True
+
+        source_model = self.sourceModel()
+        root = source_model.root_item
+        if self._visible_root is not root:
+            # New query or reloaded model
+            self._visible = self._match(source_model, self.search_text)
+            self._visible_root = root
+
+        index = source_model.index(source_row, 0, source_parent)
+        return index.internalPointer() in self._visible
+
+    @staticmethod
+    def _match(source_model: ConnectionTreeModel, search_text: str) -> set:
+        """
+        Collect the connections matching search_text and their folders.
+
+        Returns:
+            Set of tree nodes that pass the filter
+        """
+        items = (
+            item for item in source_model.connection_items()
+            if search_text in item.search_blob
+        )
+        return ConnectionFilterProxyModel._with_folders(source_model, items)
+
+    @staticmethod
+    def _with_folders(source_model: ConnectionTreeModel, items) -> set:
+        """
+        Collect connection nodes together with their folders.
+
+        Returns:
+            Set of the given nodes and every folder above them
+        """
+        visible = set()
+        root = source_model.root_item
+
+        for item in items:
+            visible.add(item)
 
-        # Set display text with folder emoji
-        self.setText(0, f"📁 {folder_name}")
+            # Stop at the first folder already marked by an earlier match
+            parent = item.parent
+            while parent is not root and parent not in visible:
+                visible.add(parent)
+                parent = parent.parent
 
-        # Store folder path
-        self.setData(0, Qt.UserRole, folder_path)
+        return visible
 
 
-class ConnectionTreeView(QTreeWidget):
+class ConnectionTreeView(QTreeView):
     """
     Tree view widget for displaying SSH connections organized in folders.
 
@@ -71,6 +494,15 @@ class ConnectionTreeView(QTreeWidget):
     def __init__(self, parent=None):
         super().__init__(parent)
 
+        self.tree_model = ConnectionTreeModel(self)
+        self.proxy_model = ConnectionFilterProxyModel(self)
+        self.proxy_model.setSourceModel(self.tree_model)
+        self.setModel(self.proxy_model)
+
+        # Folders the user had open, restored after reloads and searches
+        # (None until there is a tree to record)
+        self._expanded_paths: Optional[set] = None
+
         self.setup_ui()
         self.setup_signals()
 
@@ -78,13 +510,58 @@ class ConnectionTreeView(QTreeWidget):
         """Set up the user interface."""
         self.setHeaderHidden(True)
         self.setContextMenuPolicy(Qt.CustomContextMenu)
-        self.setDragDropMode(QTreeWidget.InternalMove)
-        self.setSelectionMode(QTreeWidget.SingleSelection)
+        self.setDragDropMode(QAbstractItemView.InternalMove)
+        self.setSelectionMode(QAbstractItemView.SingleSelection)
+
+        # All rows are single-line text: skip per-row height queries and
+        # expand/collapse animations
+        self.setUniformRowHeights(True)
+        self.setAnimated(False)
+
+        # Context menus are built once; show_context_menu sets the target
+        self._ctx_target = None
+        self._menu_empty = self._build_menu([
+            ("Create Folder", lambda: self.folder_create_requested.emit("")),
+        ])
+        self._menu_conn = self._build_menu([
+            ("Connect", lambda: self._emit_for_target(self.connection_double_clicked)),
+            None,
+            ("Edit", lambda: self._emit_for_target(self.connection_edit_requested)),
+            ("Duplicate", lambda: self._emit_for_target(self.connection_duplicate_requested)),
+            None,
+            ("Delete", lambda: self._emit_for_target(self.connection_delete_requested)),
+        ])
+        self._menu_folder = self._build_menu([
+            ("New Subfolder", lambda: self._emit_for_target(self.folder_create_requested)),
+            None,
+            ("Delete Folder", lambda: self._emit_for_target(self.folder_delete_requested)),
+        ])
+
+    def _build_menu(self, entries) -> QMenu:
+        """
+        Build a context menu.
+
+        Args:
+            entries: (label, slot) pairs, with None for a separator
+
+        Returns:
+            QMenu owned by this view
+        """
+        menu = QMenu(self)
+        for entry in entries:
+            if entry is None:
+                menu.addSeparator()
+                continue
+            label, slot = entry
+            action = QAction(label, self)
+            action.triggered.connect(slot)
+            menu.addAction(action)
+        return menu
 
     def setup_signals(self):
         """Set up signal connections."""
-        self.itemClicked.connect(self.on_item_clicked)
-        self.itemDoubleClicked.connect(self.on_item_double_clicked)
+        self.clicked.connect(self.on_item_clicked)
+        self.doubleClicked.connect(self.on_item_double_clicked)
         self.customContextMenuRequested.connect(self.show_context_menu)
 
     def load_connections(self, connections: List[Connection]):
@@ -94,74 +571,112 @@ class ConnectionTreeView(QTreeWidget):
         Args:
             connections: List of Connection objects
         """
-        self.clear()
-
-        # Organize connections by folder
-        folder_map = {}
-
-        for conn in connections:
-            folder_path = conn.folder
-
-            # Parse folder path into parts
-            folder_parts = folder_path.split('/') if folder_path else ['']
-
-            # Build nested folder structure
-            current_map = folder_map
-            current_path = ""
+        self._save_expansion()
+
+        # Updates are disabled during the reset, so repopulating and
+        # re-opening folders repaint once (callers may already have updates
+        # disabled around a larger change)
+        updates_enabled = self.updatesEnabled()
+        self.setUpdatesEnabled(False)
+        try:
+            self.setSortingEnabled(False)
+            changed = self.tree_model.load_connections(connections)
+
+            # Unchanged contents keep their rows, selection and open folders
+            if changed:
+                if self.proxy_model.search_text:
+                    self.expandAll()
+                else:
+                    self._restore_expansion()
+        finally:
+            self.setUpdatesEnabled(updates_enabled)
+
+    def _save_expansion(self):
+        """Record which folders are open, unless a search has expanded them."""
+        if self.proxy_model.search_text or not self.tree_model.root_item.children:
+            return
 
-            for i, part in enumerate(folder_parts):
-                current_path = '/'.join(folder_parts[:i+1]) if i > 0 else part
+        model = self.tree_model
+        proxy = self.proxy_model
+        self._expanded_paths = {
+            path for path in model.folder_paths()
+            if self.isExpanded(proxy.mapFromSource(model.folder_index(path)))
+        }
+
+    def _restore_expansion(self):
+        """Show exactly the recorded folders open (top-level folders on first load)."""
+        # Folders a search expanded stay open unless collapsed here
+        self.collapseAll()
+        if self._expanded_paths is None:
+            self.expandToDepth(0)
+            return
 
-                if part not in current_map:
-                    current_map[part] = {
-                        '_folders': {},
-                        '_connections': [],
-                        '_path': current_path
-                    }
+        model = self.tree_model
+        proxy = self.proxy_model
+        for path in self._expanded_paths:
+            index = proxy.mapFromSource(model.folder_index(path))
+            if index.isValid():
+                self.expand(index)
 
-                if i < len(folder_parts) - 1:
-                    current_map = current_map[part]['_folders']
+    def add_connection(self, connection: Connection):
+        """
+        Add a single connection without reloading the tree.
 
-            # Add connection to leaf folder
-            if folder_parts:
-                leaf_folder = folder_parts[-1]
-                if leaf_folder in current_map:
-                    current_map[leaf_folder]['_connections'].append(conn)
+        Args:
+            connection: Connection to add
+        """
+        self._reveal(self.tree_model.add_connection(connection))
 
-        # Build tree from folder map
-        self._build_tree(folder_map, None)
+    def update_connection(self, old: Connection, new: Connection):
+        """
+        Replace a single connection without reloading the tree.
 
-        # Expand all folders by default
-        self.expandAll()
+        Args:
+            old: Connection currently shown
+            new: Connection to show in its place
+        """
+        self._reveal(self.tree_model.update_connection(old, new))
 
-    def _build_tree(self, folder_map: dict, parent_item: Optional[QTreeWidgetItem]):
+    def remove_connection(self, connection: Connection):
         """
-        Recursively build tree from folder map.
+        Remove a single connection without reloading the tree.
 
         Args:
-            folder_map: Nested dictionary of folders and connections
-            parent_item: Parent tree item (None for root)
+            connection: Connection to remove
         """
-        for folder_name, folder_data in sorted(folder_map.items()):
-            if not folder_name:
-                continue
+        self.tree_model.remove_connection(connection)
+        if self.proxy_model.search_text:
+            self.proxy_model.refresh()
 
-            folder_path = folder_data.get('_path', folder_name)
+    def _reveal(self, source_index: Optional[QModelIndex]):
+        """Re-filter if needed, then expand to and select a changed row."""
+        if self.proxy_model.search_text:
+            self.proxy_model.refresh()
 
-            # Create folder item
-            if parent_item:
-                folder_item = FolderTreeItem(parent_item, folder_name, folder_path)
-            else:
-                folder_item = FolderTreeItem(self, folder_name, folder_path)
+        if source_index is None:
+            return
 
-            # Add connections to this folder
-            for conn in sorted(folder_data.get('_connections', []), key=lambda c: c.name):
-                ConnectionTreeItem(folder_item, conn)
+        index = self.proxy_model.mapFromSource(source_index)
+        if not index.isValid():
+            # Filtered out by the current search
+            return
 
-            # Recursively add subfolders
-            subfolders = folder_data.get('_folders', {})
-            if subfolders:
-                self._build_tree(subfolders, folder_item)
+        parent = index.parent()
+        while parent.isValid():
+            self.expand(parent)
+            parent = parent.parent()
+
+        self.setCurrentIndex(index)
+        self.scrollTo(index)
+
+    def item_at_index(self, index: QModelIndex) -> Optional[TreeItem]:
+        """
+        Get the tree node for a (proxy) view index.
+
+        Returns:
+            ConnectionTreeItem or FolderTreeItem, or None for an invalid index
+        """
+        return self.tree_model.item(self.proxy_model.mapToSource(index))
 
     def get_selected_connection(self) -> Optional[Connection]:
         """
@@ -170,9 +685,9 @@ class ConnectionTreeView(QTreeWidget):
         Returns:
             Connection object if connection is selected, None otherwise
         """
-        current = self.currentItem()
+        current = self.item_at_index(self.currentIndex())
 
-        if current and isinstance(current, ConnectionTreeItem):
+        if current is not None and current.is_connection:
             return current.connection
 
         return None
@@ -184,73 +699,47 @@ class ConnectionTreeView(QTreeWidget):
         Returns:
             Folder path if folder is selected, None otherwise
         """
-        current = self.currentItem()
+        current = self.item_at_index(self.currentIndex())
 
-        if current and isinstance(current, FolderTreeItem):
+        if current is not None and not current.is_connection:
             return current.folder_path
 
         return None
 
-    def on_item_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_item_clicked(self, index: QModelIndex):
         """Handle item click."""
-        if isinstance(item, ConnectionTreeItem):
+        item = self.item_at_index(index)
+        if item is not None and item.is_connection:
             self.connection_selected.emit(item.connection)
 
-    def on_item_double_clicked(self, item: QTreeWidgetItem, column: int):
+    def on_item_double_clicked(self, index: QModelIndex):
         """Handle item double-click (launch SSH)."""
-        if isinstance(item, ConnectionTreeItem):
+        item = self.item_at_index(index)
+        if item is not None and item.is_connection:
             self.connection_double_clicked.emit(item.connection)
 
     def show_context_menu(self, position):
         """Show right-click context menu."""
-        item = self.itemAt(position)
+        item = self.item_at_index(self.indexAt(position))
 
         if not item:
             # Clicked on empty space
-            menu = QMenu(self)
-            create_action = QAction("Create Folder", self)
-            create_action.triggered.connect(lambda: self.folder_create_requested.emit(""))
-            menu.addAction(create_action)
-            menu.exec(self.mapToGlobal(position))
-            return
-
-        menu = QMenu(self)
-
-        if isinstance(item, ConnectionTreeItem):
-            # Connection context menu
-            connect_action = QAction("Connect", self)
-            connect_action.triggered.connect(lambda: self.connection_double_clicked.emit(item.connection))
-            menu.addAction(connect_action)
-
-            menu.addSeparator()
-
-            edit_action = QAction("Edit", self)
-            edit_action.triggered.connect(lambda: self.connection_edit_requested.emit(item.connection))
-            menu.addAction(edit_action)
-
-            duplicate_action = QAction("Duplicate", self)
-            duplicate_action.triggered.connect(lambda: self.connection_duplicate_requested.emit(item.connection))
-            menu.addAction(duplicate_action)
-
-            menu.addSeparator()
-
-            delete_action = QAction("Delete", self)
-            delete_action.triggered.connect(lambda: self.connection_delete_requested.emit(item.connection))
-            menu.addAction(delete_action)
-
-        elif isinstance(item, FolderTreeItem):
-            # Folder context menu
-            create_action = QAction("New Subfolder", self)
-            create_action.triggered.connect(lambda: self.folder_create_requested.emit(item.folder_path))
-            menu.addAction(create_action)
-
-            menu.addSeparator()
-
-            delete_action = QAction("Delete Folder", self)
-            delete_action.triggered.connect(lambda: self.folder_delete_requested.emit(item.folder_path))
-            menu.addAction(delete_action)
-
-        menu.exec(self.mapToGlobal(position))
+            self._ctx_target = None
+            menu = self._menu_empty
+        elif item.is_connection:
+            self._ctx_target = item.connection
+            menu = self._menu_conn
+        else:
+            self._ctx_target = item.folder_path
+            menu = self._menu_folder
+
+        menu.exec(self.viewport().mapToGlobal(position))
+
+    def _emit_for_target(self, signal):
+        """Emit signal with the item the context menu was opened on."""
+        target = self._ctx_target
+        self._ctx_target = None
+        signal.emit(target)
 
     def filter_connections(self, search_text: str):
         """
@@ -261,56 +750,39 @@ class ConnectionTreeView(QTreeWidget):
         """
         search_text = search_text.lower()
 
-        # Show/hide items based on search
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-
-            if isinstance(item, ConnectionTreeItem):
-                # Check if connection matches search
-                conn = item.connection
-                matches = (
-                    search_text in conn.name.lower() or
-                    search_text in conn.hostname.lower() or
-                    search_text in conn.user.lower() or
-                    search_text in conn.folder.lower()
-                )
-
-                item.setHidden(not matches)
-
-                # Show parent folders if connection matches
-                if matches:
-                    parent = item.parent()
-                    while parent:
-                        parent.setHidden(False)
-                        parent = parent.parent()
-
-            elif isinstance(item, FolderTreeItem):
-                # Folder visibility will be set by child connections
-                pass
-
-            iterator += 1
-
-        # Hide empty folders
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            item = iterator.value()
-
-            if isinstance(item, FolderTreeItem):
-                has_visible_children = False
-                for i in range(item.childCount()):
-                    if not item.child(i).isHidden():
-                        has_visible_children = True
-                        break
+        # Starting a search: remember the user's folders first
+        self._save_expansion()
+
+        self.setUpdatesEnabled(False)
+        try:
+            self.proxy_model.set_search_text(search_text)
 
-                if not has_visible_children and search_text:
-                    item.setHidden(True)
+            # Reveal every match while searching, otherwise put the user's
+            # folders back the way they were before the search
+            if search_text:
+                self.expandAll()
+            else:
+                self._restore_expansion()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def show_subset(self, search_text: str, connections: List[Connection]):
+        """
+        Show only connections the caller already matched against search_text.
+
+        Args:
+            search_text: Search text the connections were matched against
+            connections: Matching connections
+        """
+        self._save_expansion()
 
-            iterator += 1
+        self.setUpdatesEnabled(False)
+        try:
+            self.proxy_model.set_matches(search_text, connections)
+            self.expandAll()
+        finally:
+            self.setUpdatesEnabled(True)
 
     def clear_filter(self):
         """Clear search filter and show all items."""
-        iterator = QTreeWidgetItemIterator(self)
-        while iterator.value():
-            iterator.value().setHidden(False)
-            iterator += 1
+        self.filter_connections("")
@@ -9,19 +9,77 @@ from PySide6.QtWidgets import (
     QToolBar, QLineEdit, QStatusBar, QMessageBox,
     QInputDialog, QLabel, QPushButton
 )
-from PySide6.QtCore import Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, QObject, QRunnable, QThreadPool, Signal, Slot
 from PySide6.QtGui import QAction, QKeySequence
-from pathlib import Path
-from typing import Optional
-
-import sys
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Dict, List, Optional, Tuple
 
 from core.config_manager import ConfigManager
 from core.connection import Connection
 from core.terminal_launcher import TerminalLauncher
-from .connection_tree import ConnectionTreeView
-from .connection_dialog import ConnectionDialog
+from .connection_tree import ConnectionTreeView, search_blob
+
+if TYPE_CHECKING:
+    from .connection_dialog import ConnectionDialog
+
+
+def _emit_result(signal, *args):
+    """Emit a pool task's result unless the window closed in the meantime."""
+    try:
+        signal.emit(*args)
+    except RuntimeError:
+        # Signals object already deleted along with the window
+        pass
+
+
+class _LoadSignals(QObject):
+    """Signals delivering background load results to the GUI thread."""
+
+    loaded = Signal(list, dict)  # connections, stats
+    failed = Signal(str)  # error message
+
+
+class _LoadConnectionsTask(QRunnable):
+    """Read connections and folder stats from disk on a pool thread."""
+
+    def __init__(self, config_manager: ConfigManager, signals: _LoadSignals):
+        super().__init__()
+        self.config_manager = config_manager
+        self.signals = signals
+
+    def run(self):
+        try:
+            connections, stats = self.config_manager.load_snapshot()
+        except Exception as e:
+            _emit_result(self.signals.failed, str(e))
+        else:
+            _emit_result(self.signals.loaded, connections, stats)
+
+
+class _DeleteFolderSignals(QObject):
+    """Signals reporting background folder deletion to the GUI thread."""
+
+    deleted = Signal(str)  # folder path
+    failed = Signal(str, str)  # folder path, error message
+
+
+class _DeleteFolderTask(QRunnable):
+    """Delete a folder and everything in it on a pool thread."""
+
+    def __init__(self, config_manager: ConfigManager, folder_path: str,
+                 signals: _DeleteFolderSignals):
+        super().__init__()
+        self.config_manager = config_manager
+        self.folder_path = folder_path
+        self.signals = signals
+
+    def run(self):
+        try:
+            self.config_manager.delete_folder(self.folder_path, recursive=True)
+        except Exception as e:
+            _emit_result(self.signals.failed, self.folder_path, str(e))
+        else:
+            _emit_result(self.signals.deleted, self.folder_path)
 
 
 class MainWindow(QMainWindow):
@@ -36,6 +94,14 @@ class MainWindow(QMainWindow):
     - Menu bar with file operations
     """
 
+    _ABOUT_HTML = (
+        "<h3>SSH Manager</h3>"
+        "<p>A clean, focused SSH session manager inspired by SecureCRT.</p>"
+        "<p>Manage your SSH connections with a simple GUI instead of manually editing config files.</p>"
+        "<p><b>Version:</b> 1.0.0</p>"
+        "<p><b>Built with:</b> PySide6 and Python</p>"
+    )
+
     def __init__(self):
         super().__init__()
 
@@ -46,6 +112,55 @@ class MainWindow(QMainWindow):
         self.selected_connection: Optional[Connection] = None
         self.selected_folder: Optional[str] = None
 
+        # Connection dialog, created on first use and reused afterwards
+        self._conn_dialog: Optional["ConnectionDialog"] = None
+        self._editing_connection: Optional[Connection] = None
+
+        # Folder paths offered by the connection dialog (None = re-scan disk)
+        self._folders_cache: Optional[List[str]] = None
+
+        # Nested _batch() blocks defer refresh_connections to the outermost exit
+        self._batch_depth = 0
+        self._refresh_pending = False
+
+        # A refresh queued by _schedule_refresh is waiting for the event loop
+        self._refresh_scheduled = False
+
+        # Status bar text last shown, and the latest one set during a batch
+        self._last_status: Optional[str] = None
+        self._queued_status: Optional[str] = None
+
+        # Connections are loaded on a pool thread; one load runs at a time
+        self._loading = False
+        self._load_task: Optional[_LoadConnectionsTask] = None
+        self._load_signals = _LoadSignals(self)
+        self._load_signals.loaded.connect(self._apply_connections)
+        self._load_signals.failed.connect(self._on_load_failed)
+
+        # Folder deletions in flight, by path (kept referenced until done)
+        self._delete_tasks: Dict[str, _DeleteFolderTask] = {}
+        self._delete_signals = _DeleteFolderSignals(self)
+        self._delete_signals.deleted.connect(self._on_folder_deleted)
+        self._delete_signals.failed.connect(self._on_folder_delete_failed)
+
+        # Lowercase search text per connection, keyed by (folder, name);
+        # rebuilt on refresh and kept in step with single edits
+        self._search_index: Dict[Tuple[str, str], Tuple[str, Connection]] = {}
+
+        # Previous query and its (blob, connection) hits, narrowed when the
+        # next query extends it (None whenever the index changes)
+        self._last_query = ""
+        self._last_matches: Optional[List[Tuple[str, Connection]]] = None
+
+        # Whether the tree is currently filtered (clearing twice is a no-op)
+        self._filter_active = False
+
+        # Coalesce keystrokes in the search box into one filter pass
+        self._search_timer = QTimer(self)
+        self._search_timer.setSingleShot(True)
+        self._search_timer.setInterval(150)
+        self._search_timer.timeout.connect(self._do_filter)
+
         # Setup UI
         self.setup_ui()
         self.setup_menu()
@@ -94,6 +209,8 @@ class MainWindow(QMainWindow):
         # Status bar
         self.status_bar = QStatusBar()
         self.setStatusBar(self.status_bar)
+        # Menu hover clears the message; keep _last_status in step with it
+        self.status_bar.messageChanged.connect(self._on_status_changed)
         self.update_status("Ready")
 
     def setup_menu(self):
@@ -112,7 +229,7 @@ class MainWindow(QMainWindow):
 
         refresh_action = QAction("Refresh", self)
         refresh_action.setShortcut(QKeySequence.Refresh)
-        refresh_action.triggered.connect(self.refresh_connections)
+        refresh_action.triggered.connect(self.reload_connections)
         file_menu.addAction(refresh_action)
 
         file_menu.addSeparator()
@@ -219,26 +336,146 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Initialization Error", f"Failed to initialize SSH Manager:\n{e}")
 
+    @contextmanager
+    def _batch(self):
+        """Coalesce refresh_connections and status updates made inside the block."""
+        self._batch_depth += 1
+        try:
+            yield
+        finally:
+            self._batch_depth -= 1
+            if self._batch_depth == 0:
+                if self._queued_status is not None:
+                    message, self._queued_status = self._queued_status, None
+                    self.update_status(message)
+                if self._refresh_pending:
+                    self._refresh_pending = False
+                    self.refresh_connections()
+
+    @Slot()
+    def reload_connections(self):
+        """Re-read connections from disk, picking up changes made outside the app."""
+        self.config_manager.invalidate_snapshot()
+        self.refresh_connections()
+
+    def _schedule_refresh(self):
+        """Refresh once control returns to the event loop, however often called."""
+        if self._refresh_scheduled:
+            return
+
+        self._refresh_scheduled = True
+        QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    @Slot()
+    def _run_scheduled_refresh(self):
+        """Run the refresh queued by _schedule_refresh."""
+        self._refresh_scheduled = False
+        self.refresh_connections()
+
+    @Slot()
     def refresh_connections(self):
-        """Reload all connections from disk."""
+        """
+        Reload all connections from disk in the background.
+
+        Deferred while batching; a request made during a load runs once
+        that load finishes.
+        """
+        if self._batch_depth or self._loading:
+            self._refresh_pending = True
+            return
+
+        # Keep the task referenced until its result is delivered
+        self._folders_cache = None
+        self._loading = True
+        self._load_task = _LoadConnectionsTask(self.config_manager, self._load_signals)
+        self._load_task.setAutoDelete(False)
+        QThreadPool.globalInstance().start(self._load_task)
+
+    @Slot(list, dict)
+    def _apply_connections(self, connections: list, stats: dict):
+        """Show connections loaded by refresh_connections."""
+        self._loading = False
+        self._load_task = None
+        if self._reload_if_pending():
+            return
+
+        # One repaint for the whole reload. The model's signals are left
+        # alone: a reload is a single reset, and the view and search proxy
+        # rely on seeing it.
+        self.tree_view.setUpdatesEnabled(False)
         try:
-            connections = self.config_manager.list_connections()
             self.tree_view.load_connections(connections)
+        finally:
+            self.tree_view.setUpdatesEnabled(True)
+
+        self._search_index = {
+            (conn.folder, conn.name): (search_blob(conn), conn)
+            for conn in connections
+        }
+        self._last_matches = None
+
+        # Update status
+        self.update_status(f"{stats['total_connections']} connections in {stats['total_folders']} folders")
+
+    @Slot(str)
+    def _on_load_failed(self, message: str):
+        """Report a failed background load."""
+        self._loading = False
+        self._load_task = None
+        if self._reload_if_pending():
+            return
 
-            # Update status
-            stats = self.config_manager.get_stats()
-            self.update_status(f"{stats['total_connections']} connections in {stats['total_folders']} folders")
+        QMessageBox.critical(self, "Error", f"Failed to load connections:\n{message}")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to load connections:\n{e}")
+    def _reload_if_pending(self) -> bool:
+        """Start a refresh requested during the last load; True if started."""
+        if not self._refresh_pending or self._batch_depth:
+            return False
 
+        self._refresh_pending = False
+        self.refresh_connections()
+        return True
+
+    @Slot()
     def new_connection(self):
         """Open dialog to create new connection."""
-        folders = self.config_manager.list_folders()
-
-        dialog = ConnectionDialog(self, connection=None, folders=folders)
-        dialog.connection_saved.connect(self.save_new_connection)
-        dialog.exec()
+        folders = self._get_folders()
+        self.show_connection_dialog(None, folders)
+
+    def show_connection_dialog(self, connection: Optional[Connection], folders: list):
+        """
+        Show the shared connection dialog.
+
+        Args:
+            connection: Connection to edit, or None to create a new one
+            folders: Folder paths offered in the dialog
+        """
+        if self._conn_dialog is None:
+            # Imported on first use; most sessions never open the dialog
+            from .connection_dialog import ConnectionDialog
+
+            self._conn_dialog = ConnectionDialog(self, connection=connection, folders=folders)
+            self._conn_dialog.connection_saved.connect(self.on_connection_saved)
+        else:
+            self._conn_dialog.reset_for(connection, folders)
+
+        self._editing_connection = connection
+        self._conn_dialog.exec()
+        self._editing_connection = None
+
+    def _get_folders(self) -> List[str]:
+        """Get folder paths, scanning disk only after a change."""
+        if self._folders_cache is None:
+            self._folders_cache = self.config_manager.list_folders()
+        return self._folders_cache
+
+    @Slot(Connection)
+    def on_connection_saved(self, connection: Connection):
+        """Route a saved dialog to the create or update path."""
+        if self._editing_connection is None:
+            self.save_new_connection(connection)
+        else:
+            self.save_edited_connection(self._editing_connection, connection)
 
     def save_new_connection(self, connection: Connection):
         """Save new connection to disk."""
@@ -252,22 +489,26 @@ class MainWindow(QMainWindow):
                 )
                 return
 
-            # Save connection
+            # Save connection (may create its folder)
             self.config_manager.save_connection(connection)
+            self._folders_cache = None
 
-            # Refresh tree
-            self.refresh_connections()
+            # Update tree in place
+            self.tree_view.add_connection(connection)
+            self._index_connection(connection)
 
             self.update_status(f"Created connection: {connection.name}")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to save connection:\n{e}")
 
+    @Slot(Connection)
     def on_connection_selected(self, connection: Connection):
         """Handle connection selection."""
         self.selected_connection = connection
         self.selected_folder = None
 
+    @Slot()
     def edit_selected_connection(self):
         """Edit selected connection."""
         connection = self.tree_view.get_selected_connection()
@@ -278,32 +519,38 @@ class MainWindow(QMainWindow):
 
         self.edit_connection(connection)
 
+    @Slot(Connection)
     def edit_connection(self, connection: Connection):
         """Open dialog to edit connection."""
-        folders = self.config_manager.list_folders()
-
-        dialog = ConnectionDialog(self, connection=connection, folders=folders)
-        dialog.connection_saved.connect(lambda conn: self.save_edited_connection(connection, conn))
-        dialog.exec()
+        folders = self._get_folders()
+        self.show_connection_dialog(connection, folders)
 
     def save_edited_connection(self, old_connection: Connection, new_connection: Connection):
         """Save edited connection."""
-        try:
-            # Delete old connection if name or folder changed
-            if old_connection.name != new_connection.name or old_connection.folder != new_connection.folder:
-                self.config_manager.delete_connection(old_connection.folder, old_connection.name)
+        with self._batch():
+            try:
+                # Delete old connection if name or folder changed
+                if old_connection.name != new_connection.name or old_connection.folder != new_connection.folder:
+                    self.config_manager.delete_connection(old_connection.folder, old_connection.name)
 
-            # Save new connection
-            self.config_manager.save_connection(new_connection)
+                # Save new connection (may create its folder)
+                self.config_manager.save_connection(new_connection)
+                self._folders_cache = None
 
-            # Refresh tree
-            self.refresh_connections()
+                # Update tree in place
+                self.tree_view.update_connection(old_connection, new_connection)
+                self._unindex_connection(old_connection)
+                self._index_connection(new_connection)
 
-            self.update_status(f"Updated connection: {new_connection.name}")
+                self.update_status(f"Updated connection: {new_connection.name}")
 
-        except Exception as e:
-            QMessageBox.critical(self, "Error", f"Failed to update connection:\n{e}")
+            except Exception as e:
+                # The old file may already be gone; the batch defers this
+                # resync until the edit is finished
+                self.refresh_connections()
+                QMessageBox.critical(self, "Error", f"Failed to update connection:\n{e}")
 
+    @Slot()
     def duplicate_selected_connection(self):
         """Duplicate selected connection."""
         connection = self.tree_view.get_selected_connection()
@@ -314,14 +561,17 @@ class MainWindow(QMainWindow):
 
         self.duplicate_connection(connection)
 
+    @Slot(Connection)
     def duplicate_connection(self, connection: Connection):
         """Create a copy of connection."""
         # Create new connection with "-copy" suffix
         new_name = f"{connection.name}-copy"
 
-        # Find unique name
+        # Find unique name: skip names already shown in this folder, then
+        # confirm on disk only for the candidate that survives
+        existing = {name for folder, name in self._search_index if folder == connection.folder}
         counter = 1
-        while self.config_manager.connection_exists(connection.folder, new_name):
+        while new_name in existing or self.config_manager.connection_exists(connection.folder, new_name):
             new_name = f"{connection.name}-copy{counter}"
             counter += 1
 
@@ -341,12 +591,14 @@ class MainWindow(QMainWindow):
 
         try:
             self.config_manager.save_connection(new_conn)
-            self.refresh_connections()
+            self.tree_view.add_connection(new_conn)
+            self._index_connection(new_conn)
             self.update_status(f"Duplicated connection: {new_conn.name}")
 
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to duplicate connection:\n{e}")
 
+    @Slot()
     def delete_selected(self):
         """Delete selected connection or folder."""
         connection = self.tree_view.get_selected_connection()
@@ -359,6 +611,7 @@ class MainWindow(QMainWindow):
         else:
             QMessageBox.information(self, "No Selection", "Please select a connection or folder to delete.")
 
+    @Slot(Connection)
     def delete_connection(self, connection: Connection):
         """Delete a connection with confirmation."""
         reply = QMessageBox.question(
@@ -371,12 +624,14 @@ class MainWindow(QMainWindow):
         if reply == QMessageBox.Yes:
             try:
                 self.config_manager.delete_connection(connection.folder, connection.name)
-                self.refresh_connections()
+                self.tree_view.remove_connection(connection)
+                self._unindex_connection(connection)
                 self.update_status(f"Deleted connection: {connection.name}")
 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to delete connection:\n{e}")
 
+    @Slot(str)
     def create_folder(self, parent_folder: str):
         """Create new folder."""
         folder_name, ok = QInputDialog.getText(
@@ -394,12 +649,14 @@ class MainWindow(QMainWindow):
 
             try:
                 self.config_manager.create_folder(full_path)
-                self.refresh_connections()
+                self._folders_cache = None
+                self._schedule_refresh()
                 self.update_status(f"Created folder: {full_path}")
 
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to create folder:\n{e}")
 
+    @Slot(str)
     def delete_folder(self, folder_path: str):
         """Delete a folder with confirmation."""
         reply = QMessageBox.question(
@@ -409,15 +666,33 @@ class MainWindow(QMainWindow):
             QMessageBox.Yes | QMessageBox.No
         )
 
-        if reply == QMessageBox.Yes:
-            try:
-                self.config_manager.delete_folder(folder_path, recursive=True)
-                self.refresh_connections()
-                self.update_status(f"Deleted folder: {folder_path}")
-
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to delete folder:\n{e}")
-
+        if reply == QMessageBox.Yes and folder_path not in self._delete_tasks:
+            # Large folders can take a while; delete off the GUI thread
+            task = _DeleteFolderTask(self.config_manager, folder_path, self._delete_signals)
+            task.setAutoDelete(False)
+            self._delete_tasks[folder_path] = task
+            self.update_status(f"Deleting folder: {folder_path}...")
+            QThreadPool.globalInstance().start(task)
+
+    @Slot(str)
+    def _on_folder_deleted(self, folder_path: str):
+        """Reload once a background folder deletion has finished."""
+        self._delete_tasks.pop(folder_path, None)
+        self._folders_cache = None
+        self._schedule_refresh()
+        self.update_status(f"Deleted folder: {folder_path}")
+
+    @Slot(str, str)
+    def _on_folder_delete_failed(self, folder_path: str, message: str):
+        """Report a failed background folder deletion."""
+        self._delete_tasks.pop(folder_path, None)
+
+        # Part of the folder may already be gone
+        self._folders_cache = None
+        self._schedule_refresh()
+        QMessageBox.critical(self, "Error", f"Failed to delete folder:\n{message}")
+
+    @Slot()
     def connect_selected(self):
         """Connect to selected connection."""
         connection = self.tree_view.get_selected_connection()
@@ -428,6 +703,7 @@ class MainWindow(QMainWindow):
 
         self.launch_ssh_connection(connection)
 
+    @Slot(Connection)
     def launch_ssh_connection(self, connection: Connection):
         """Launch SSH connection in terminal."""
         try:
@@ -448,25 +724,83 @@ class MainWindow(QMainWindow):
         except Exception as e:
             QMessageBox.critical(self, "Error", f"Failed to launch SSH connection:\n{e}")
 
+    @Slot(str)
     def on_search_changed(self, text: str):
-        """Handle search input change."""
-        if text.strip():
-            self.tree_view.filter_connections(text.strip())
-        else:
+        """Handle search input change (filtering runs 150 ms after the last edit)."""
+        self._search_timer.start()
+
+    @Slot()
+    def _do_filter(self):
+        """Filter the tree by the current search text."""
+        text = self.search_input.text().strip()
+        if text:
+            query = text.lower()
+            self._filter_active = True
+            self.tree_view.show_subset(query, self._search_matches(query))
+        elif self._filter_active:
+            self._filter_active = False
             self.tree_view.clear_filter()
 
+    def _search_matches(self, query: str) -> List[Connection]:
+        """
+        Look up connections matching a search query in the cached index.
+
+        Args:
+            query: Lowercase search text
+
+        Returns:
+            Matching connections
+        """
+        if self._last_matches is not None and query.startswith(self._last_query):
+            # Anything matching the longer query matched the shorter one
+            candidates = self._last_matches
+        else:
+            candidates = self._search_index.values()
+
+        matches = [entry for entry in candidates if query in entry[0]]
+        self._last_query = query
+        self._last_matches = matches
+
+        return [conn for _, conn in matches]
+
+    def _index_connection(self, connection: Connection):
+        """Add a connection to the search index."""
+        if self._loading:
+            # The running load may predate this change
+            self._refresh_pending = True
+        self._last_matches = None
+        self._search_index[(connection.folder, connection.name)] = (search_blob(connection), connection)
+
+    def _unindex_connection(self, connection: Connection):
+        """Remove a connection from the search index."""
+        if self._loading:
+            # The running load may predate this change
+            self._refresh_pending = True
+        self._last_matches = None
+        self._search_index.pop((connection.folder, connection.name), None)
+
     def update_status(self, message: str):
-        """Update status bar message."""
+        """
+        Update status bar message.
+
+        Inside a _batch() block only the last message is shown, once the
+        block exits. Repeating the current message does not repaint.
+        """
+        if self._batch_depth:
+            self._queued_status = message
+            return
+        if message == self._last_status:
+            return
+
+        self._last_status = message
         self.status_bar.showMessage(message)
 
+    @Slot(str)
+    def _on_status_changed(self, message: str):
+        """Track status bar changes made outside update_status."""
+        self._last_status = message
+
+    @Slot()
     def show_about(self):
         """Show about dialog."""
-        QMessageBox.about(
-            self,
-            "About SSH Manager",
-            "<h3>SSH Manager</h3>"
-            "<p>A clean, focused SSH session manager inspired by SecureCRT.</p>"
-            "<p>Manage your SSH connections with a simple GUI instead of manually editing config files.</p>"
-            "<p><b>Version:</b> 1.0.0</p>"
-            "<p><b>Built with:</b> PySide6 and Python</p>"
-        )
+        QMessageBox.about(self, "About SSH Manager", self._ABOUT_HTML)